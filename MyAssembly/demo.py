@@ -25,7 +25,7 @@ def main():
     # Load microcode ROM
     print("\n1. Loading microcode ROM...")
     microcode = load_microcode('microcode/microcode.bin')
-    print(f"   ✓ Loaded {len(microcode)} bytes")
+    print(f"   ✓ Loaded {len(microcode)} control words")
     
     # Create CPU
     print("\n2. Initializing CPU...")
@@ -56,9 +56,8 @@ def main():
     print("\n5. Initial RAM state:")
     cpu.dump_ram()
     
-    # Connect clock to CPU
-    print("\n6. Connecting clock to CPU...")
-    clock.on_rising_edge(cpu.clock_cycle)
+    # Start the clock
+    print("\n6. Starting clock...")
     clock.start()
     print("   ✓ Clock started")
     
@@ -66,20 +65,18 @@ def main():
     print("\n7. Running program...")
     print("-" * 70)
     
-    cycle = 0
+    cycle = [0]  # Use list for mutability in nested function
     start_time = time.time()
     
-    while not cpu.halted and cycle < 100:
-        # Tick the clock
-        if clock.tick():
-            # Clock edge occurred - CPU already executed via callback
-            if cycle % 5 == 0:  # Print every 5 cycles to avoid spam
-                print(f"   Cycle {cycle:3d}: PC={cpu.pc:X} IR=0x{cpu.ir:02X} "
-                      f"A=0x{cpu.a:02X} B=0x{cpu.b:02X}")
-            cycle += 1
-        
-        # Small sleep to allow clock timing
-        time.sleep(0.01)
+    def on_cycle():
+        # CPU already executed on this cycle's rising edge
+        if cycle[0] % 5 == 0:  # Print every 5 cycles to avoid spam
+            print(f"   Cycle {cycle[0]:3d}: PC={cpu.pc:X} IR=0x{cpu.ir:02X} "
+                  f"A=0x{cpu.a:02X} B=0x{cpu.b:02X}")
+        cycle[0] += 1
+    
+    clock.on_falling_edge(on_cycle)
+    clock.run(cpu.clock_cycle, 100, lambda: cpu.halted)
     
     elapsed = time.time() - start_time
     clock.stop()
@@ -9,6 +9,7 @@ Provides clock signals for:
 The clock drives the microcode sequencer through each instruction cycle.
 """
 
+import sys
 import time
 from enum import Enum
 from typing import Callable, Optional
@@ -34,17 +35,27 @@ class Clock:
         self.mode = mode
         self.frequency_hz = frequency_hz
         self.period = 1.0 / frequency_hz if frequency_hz > 0 else 1.0
+        self.half_period_ns = round(self.period * 1e9 / 2)
         
         self.running = False
         self.cycle_count = 0
         self.state = False  # False = low, True = high
         
-        # Callbacks for edge detection
+        # Callbacks for edge detection, plus tuple copies fired on each edge
         self.rising_edge_callbacks = []
         self.falling_edge_callbacks = []
+        self._freeze_callbacks()
         
-        # Timing
-        self.last_edge_time = 0
+        # Timing: monotonic deadline of the next edge, in nanoseconds
+        self.next_edge_ns = 0
+        
+        # tick() is bound once per mode rather than re-dispatched every call
+        self.tick = {
+            ClockMode.EMULATOR: self._tick_timed,
+            ClockMode.ARDUINO: self._tick_timed,
+            ClockMode.TIMER_555: self._tick_timed,
+            ClockMode.MANUAL: self._tick_manual,
+        }[mode]
         
         print(f"Clock initialized: {mode.value} mode at {frequency_hz} Hz")
     
@@ -52,12 +63,14 @@ class Clock:
         """Change clock frequency (for emulator/manual modes)."""
         self.frequency_hz = hz
         self.period = 1.0 / hz if hz > 0 else 1.0
+        self.half_period_ns = round(self.period * 1e9 / 2)
         print(f"Clock frequency set to {hz} Hz (period: {self.period*1000:.2f}ms)")
     
     def start(self):
         """Start the clock."""
         self.running = True
-        self.last_edge_time = time.time()
+        self._freeze_callbacks()
+        self.next_edge_ns = time.monotonic_ns() + self.half_period_ns
         print(f"Clock started at {self.frequency_hz} Hz")
     
     def stop(self):
@@ -69,60 +82,84 @@ class Clock:
         """Reset clock to initial state."""
         self.cycle_count = 0
         self.state = False
-        self.last_edge_time = 0
+        self.next_edge_ns = time.monotonic_ns() + self.half_period_ns
         print("Clock reset")
     
     def on_rising_edge(self, callback: Callable):
         """Register callback for rising edge (0→1 transition)."""
         self.rising_edge_callbacks.append(callback)
+        self._freeze_callbacks()
     
     def on_falling_edge(self, callback: Callable):
         """Register callback for falling edge (1→0 transition)."""
         self.falling_edge_callbacks.append(callback)
+        self._freeze_callbacks()
+    
+    def _freeze_callbacks(self):
+        """Snapshot the callback lists into the tuples fired on each edge."""
+        self._rising_fast = tuple(self.rising_edge_callbacks)
+        self._falling_fast = tuple(self.falling_edge_callbacks)
     
-    def tick(self) -> bool:
+    def _tick_timed(self) -> bool:
         """
-        Advance clock by one half-cycle.
+        Advance clock by one half-cycle if the next edge is due.
         Returns True if edge occurred, False otherwise.
+        
+        Emulator, Arduino and 555 modes share one timing model here; real
+        hardware would be interrupt-driven or read the 555 from a GPIO pin.
         """
-        if not self.running:
-            return False
+        if self.running and time.monotonic_ns() >= self.next_edge_ns:
+            self.next_edge_ns += self.half_period_ns
+            self._toggle_state()
+            return True
         
-        current_time = time.time()
+        return False
+    
+    def _tick_manual(self) -> bool:
+        """Manual stepping - only advances when step() is called."""
+        return False
+    
+    def run_until(self, predicate: Callable[[], bool]):
+        """
+        Drive the clock until predicate() returns True.
         
-        if self.mode == ClockMode.EMULATOR:
-            # Software-controlled timing (Dell computer clock)
-            elapsed = current_time - self.last_edge_time
-            
-            if elapsed >= self.period / 2:
-                self._toggle_state()
-                self.last_edge_time = current_time
-                return True
+        Runs whole cycles through run() with no per-cycle callback, so only
+        the registered edge callbacks fire. Manual clocks never free-run;
+        use step().
+        """
+        self.run(lambda: None, sys.maxsize, predicate)
+    
+    def run(self, callback: Callable, max_cycles: int,
+            stop_predicate: Optional[Callable[[], bool]] = None) -> int:
+        """
+        Call callback() once per clock cycle, on schedule.
         
-        elif self.mode == ClockMode.ARDUINO:
-            # Simulate hardware timer (would be interrupt-driven on real Arduino)
-            elapsed = current_time - self.last_edge_time
-            
-            if elapsed >= self.period / 2:
-                self._toggle_state()
-                self.last_edge_time = current_time
-                return True
+        Each cycle sleeps until the rising edge, fires the rising-edge
+        callbacks and then callback, sleeps until the falling edge and fires
+        the falling-edge callbacks. Stops after max_cycles cycles, when
+        stop_predicate() returns True, or when the clock is stopped.
+        Manual clocks never free-run; use step().
         
-        elif self.mode == ClockMode.TIMER_555:
-            # External hardware clock - would read from GPIO pin
-            # For emulation, we simulate the 555 timer behavior
-            elapsed = current_time - self.last_edge_time
-            
-            if elapsed >= self.period / 2:
-                self._toggle_state()
-                self.last_edge_time = current_time
-                return True
+        Returns:
+            Number of cycles run
+        """
+        if not self.running or self.mode == ClockMode.MANUAL:
+            return 0
         
-        elif self.mode == ClockMode.MANUAL:
-            # Manual stepping - only advances when explicitly called
-            pass
+        n = 0
+        while self.running and n < max_cycles and not (stop_predicate and stop_predicate()):
+            for _ in range(2):  # rising edge, then falling edge
+                delay_ns = self.next_edge_ns - time.monotonic_ns()
+                if delay_ns > 0:
+                    time.sleep(delay_ns / 1e9)
+                
+                self.next_edge_ns += self.half_period_ns
+                self._toggle_state()
+                if self.state:
+                    callback()
+            n += 1
         
-        return False
+        return n
     
     def step(self):
         """
@@ -131,7 +168,8 @@ class Clock:
         """
         # Rising edge
         self.state = True
-        self._fire_callbacks(self.rising_edge_callbacks)
+        for callback in self._rising_fast:
+            callback()
         
         # Small delay to visualize
         if self.mode == ClockMode.MANUAL:
@@ -139,27 +177,26 @@ class Clock:
         
         # Falling edge
         self.state = False
-        self._fire_callbacks(self.falling_edge_callbacks)
+        for callback in self._falling_fast:
+            callback()
         
         self.cycle_count += 1
     
     def _toggle_state(self):
-        """Toggle clock state and fire appropriate callbacks."""
+        """
+        Toggle clock state and fire appropriate callbacks.
+        
+        Exceptions raised by a callback propagate to the caller.
+        """
         self.state = not self.state
         
         if self.state:  # Rising edge
-            self._fire_callbacks(self.rising_edge_callbacks)
+            for callback in self._rising_fast:
+                callback()
         else:  # Falling edge
-            self._fire_callbacks(self.falling_edge_callbacks)
-            self.cycle_count += 1
-    
-    def _fire_callbacks(self, callbacks):
-        """Execute all registered callbacks."""
-        for callback in callbacks:
-            try:
+            for callback in self._falling_fast:
                 callback()
-            except Exception as e:
-                print(f"Clock callback error: {e}")
+            self.cycle_count += 1
     
     def get_status(self) -> dict:
         """Get current clock status."""
@@ -291,8 +328,21 @@ if __name__ == '__main__':
     for i in range(3):
         manual_clock.step()
     
+    # Reset re-arms the deadline, so a running clock does not burst edges
+    print("\n3. Reset on a running clock (1 kHz, 50ms of ticks):")
+    fast_clock = create_clock('emulator', 'turbo')
+    fast_clock.start()
+    fast_clock.reset()
+    edges = 0
+    start = time.monotonic()
+    while time.monotonic() - start < 0.05:
+        edges += fast_clock.tick()
+    fast_clock.stop()
+    print(f"  {edges} edges")
+    assert edges <= 2 * 50 + 2, f"reset left the clock behind: {edges} edges"
+    
     # Test 555 timer design
-    print("\n3. 555 Timer Design:")
+    print("\n4. 555 Timer Design:")
     print("\nDesigning for 1 Hz clock:")
     r1, r2 = Timer555Emulator.design_for_frequency(1.0, 10e-6)
     timer = Timer555Emulator(r1, r2, 10e-6)
@@ -5,12 +5,33 @@ Implements a clock-driven CPU that executes microcode instructions.
 Based on Ben Eater's breadboard computer design.
 """
 
+import sys
 import time
+from array import array
 from typing import Optional, List
 from dataclasses import dataclass
 
+try:
+    from . import cpu_numba  # Optional: needs numpy and numba
+except ImportError:
+    cpu_numba = None
 
-@dataclass
+
+# Control signal names, indexed by bit position in the control word
+_SIGNAL_NAMES = (
+    "PC_OUT", "PC_INC", "MAR_IN", "RAM_OUT", "RAM_IN",
+    "IR_IN", "IR_OUT", "A_IN", "A_OUT", "B_IN",
+    "B_OUT", "ALU_OUT", "ALU_SUB", "HALT", "FLAGS_IN",
+)
+
+
+def describe_control_word(word: int) -> str:
+    """List the active signals in a control word, e.g. "PC_OUT | MAR_IN"."""
+    active = " | ".join(name for i, name in enumerate(_SIGNAL_NAMES) if word & (1 << i))
+    return active or "NOP"
+
+
+@dataclass(slots=True)
 class ControlSignals:
     """Control signals decoded from microcode ROM."""
     PC_OUT: bool = False
@@ -32,42 +53,146 @@ class ControlSignals:
     @classmethod
     def from_word(cls, word: int):
         """Decode 16-bit control word into signals."""
-        return cls(
-            PC_OUT=(word & 0x0001) != 0,
-            PC_INC=(word & 0x0002) != 0,
-            MAR_IN=(word & 0x0004) != 0,
-            RAM_OUT=(word & 0x0008) != 0,
-            RAM_IN=(word & 0x0010) != 0,
-            IR_IN=(word & 0x0020) != 0,
-            IR_OUT=(word & 0x0040) != 0,
-            A_IN=(word & 0x0080) != 0,
-            A_OUT=(word & 0x0100) != 0,
-            B_IN=(word & 0x0200) != 0,
-            B_OUT=(word & 0x0400) != 0,
-            ALU_OUT=(word & 0x0800) != 0,
-            ALU_SUB=(word & 0x1000) != 0,
-            HALT=(word & 0x2000) != 0,
-            FLAGS_IN=(word & 0x4000) != 0,
-        )
+        return cls(**{name: (word & (1 << i)) != 0 for i, name in enumerate(_SIGNAL_NAMES)})
+    
+    def to_word(self) -> int:
+        """Encode signals back into a 16-bit control word."""
+        return sum(1 << i for i, name in enumerate(_SIGNAL_NAMES) if getattr(self, name))
     
     def __repr__(self):
-        active = []
-        if self.PC_OUT: active.append("PC_OUT")
-        if self.PC_INC: active.append("PC_INC")
-        if self.MAR_IN: active.append("MAR_IN")
-        if self.RAM_OUT: active.append("RAM_OUT")
-        if self.RAM_IN: active.append("RAM_IN")
-        if self.IR_IN: active.append("IR_IN")
-        if self.IR_OUT: active.append("IR_OUT")
-        if self.A_IN: active.append("A_IN")
-        if self.A_OUT: active.append("A_OUT")
-        if self.B_IN: active.append("B_IN")
-        if self.B_OUT: active.append("B_OUT")
-        if self.ALU_OUT: active.append("ALU_OUT")
-        if self.ALU_SUB: active.append("ALU_SUB")
-        if self.HALT: active.append("HALT")
-        if self.FLAGS_IN: active.append("FLAGS_IN")
-        return " | ".join(active) if active else "NOP"
+        return describe_control_word(self.to_word())
+
+
+# Byte translation table for dump_ram: printable ASCII kept, the rest as "."
+_PRINTABLE = bytes(c if 32 <= c < 127 else ord(".") for c in range(256))
+
+
+# Source for each control signal's effect, in the order _execute_signals_fast
+# applies them: bus writes first, then bus reads, then PC increment.
+# ALU_OUT, ALU_SUB, FLAGS_IN and HALT are handled in _compile_handler.
+_BUS_WRITE_SOURCE = (
+    (0x0001, "bus = c.pc & 0xFF"),      # PC_OUT
+    (0x0008, "bus = c.ram[c.mar]"),     # RAM_OUT
+    (0x0040, "bus = c.ir"),             # IR_OUT
+    (0x0100, "bus = c.a"),              # A_OUT
+    (0x0400, "bus = c.b"),              # B_OUT
+)
+
+_BUS_READ_SOURCE = (
+    (0x0004, "c.mar = bus & 0x0F"),     # MAR_IN
+    (0x0010, "c.ram[c.mar] = bus"),     # RAM_IN
+    (0x0020, "c.ir = bus; c._ir_base = bus << 3"),  # IR_IN
+    (0x0080, "c.a = bus"),              # A_IN
+    (0x0200, "c.b = bus"),              # B_IN
+    (0x0002, "c.pc = (c.pc + 1) & 0x0F"),  # PC_INC
+)
+
+
+def _signal_source(cw: int) -> list:
+    """
+    Source lines applying only the signals active in a control word.
+    
+    The lines are straight-line code equivalent to CPU._execute_signals_fast
+    for this word, with every inactive signal's test removed.
+    """
+    if cw & 0x2000:  # HALT suppresses every other signal
+        return ["c.halted = True"]
+    
+    lines = []
+    bus_written = False
+    
+    for bit, source in _BUS_WRITE_SOURCE:
+        if cw & bit:
+            lines.append(source)
+            bus_written = True
+    
+    if cw & 0x0800:  # ALU_OUT
+        if cw & 0x1000:  # ALU_SUB
+            lines.append("r = c.a - c.b")
+            carry = "(r < 0)"
+        else:
+            lines.append("r = c.a + c.b")
+            carry = "(r > 0xFF)"
+        lines.append("bus = r & 0xFF")
+        if cw & 0x4000:  # FLAGS_IN
+            lines.append(f"c.flags = {carry} | ((bus == 0) << 1)")
+        bus_written = True
+    
+    reads = [source for bit, source in _BUS_READ_SOURCE if cw & bit]
+    if reads and not bus_written:
+        lines.append("bus = c.bus")
+    lines.extend(reads)
+    
+    if bus_written:
+        lines.append("c.bus = bus")
+    
+    return lines
+
+
+def _compile(lines: list, filename: str):
+    """Compile source lines into a function of the CPU, h(c)."""
+    src = "def h(c):\n" + "".join(f"    {line}\n" for line in lines or ["pass"])
+    namespace = {}
+    exec(compile(src, filename, "exec"), namespace)
+    return namespace["h"]
+
+
+def _compile_handler(cw: int):
+    """Generate a function applying one microcode step's control word."""
+    return _compile(_signal_source(cw), f"<microcode 0x{cw:04X}>")
+
+
+# Fetch T0 (PC -> MAR) and T1 (RAM -> IR, PC++)
+_FETCH_SOURCE = [
+    "c.bus = c.pc",
+    "c.mar = c.bus & 0x0F",
+    "c.bus = c.ram[c.mar]",
+    "c.ir = c.bus",
+    "c._ir_base = c.bus << 3",
+    "c.pc = (c.pc + 1) & 0x0F",
+]
+
+
+def _compile_opcode_handler(opcode: int, cw_table):
+    """
+    Generate a function running one whole instruction: fetch plus T0-T2.
+    
+    Must be called at an instruction boundary. The result leaves the CPU
+    in exactly the state five clock_cycle() calls would, including a HALT
+    part-way through. Opcodes whose microcode loads IR change which ROM
+    row the later steps read, so those step through clock_cycle instead.
+    """
+    steps = [cw_table[(opcode << 3) | step] for step in range(3)]
+    
+    if any(cw & 0x0020 for cw in steps):  # IR_IN
+        return _run_instruction_stepwise
+    
+    lines = list(_FETCH_SOURCE)
+    
+    for step, cw in enumerate(steps):
+        lines.extend(_signal_source(cw))
+        
+        if cw & 0x2000:  # HALT: clock_cycle stops after this step
+            lines.append(f"c.cycle_count += {step + 3}")
+            if step < 2:
+                lines.append("c.fetching = False")
+                lines.append("c.fetch_step = 1")
+                lines.append(f"c.micro_step = {step + 1}")
+            else:
+                lines.append("c.instruction_count += 1")
+            break
+    else:
+        lines.append("c.cycle_count += 5")
+        lines.append("c.instruction_count += 1")
+    
+    return _compile(lines, f"<opcode 0x{opcode:02X}>")
+
+
+def _run_instruction_stepwise(c):
+    """Run one instruction cycle by cycle, for opcodes that reload IR."""
+    c.clock_cycle()
+    while not c.halted and not (c.fetching and c.fetch_step == 0):
+        c.clock_cycle()
 
 
 class CPU:
@@ -89,11 +214,12 @@ class CPU:
     - 8-bit data bus connecting all components
     """
     
-    def __init__(self, microcode_rom: bytes, debug: bool = False):
+    def __init__(self, microcode_rom, debug: bool = False):
         # Registers
         self.pc = 0          # Program counter (4 bits)
         self.mar = 0         # Memory address register (4 bits)
         self.ir = 0          # Instruction register (8 bits)
+        self._ir_base = 0    # ROM row of IR (ir << 3), kept in step with ir
         self.a = 0           # Register A (8 bits)
         self.b = 0           # Register B (8 bits)
         self.flags = 0       # Flags: bit 0 = Carry, bit 1 = Zero
@@ -106,26 +232,72 @@ class CPU:
         
         # Control
         self.microcode = microcode_rom
+        self.cw_table = self._build_cw_table(microcode_rom)
         self.micro_step = 0  # Current micro-step in instruction
         self.fetching = True # True = fetch phase, False = execute phase
         self.fetch_step = 0  # Step within fetch cycle (0 or 1)
         self.halted = False
         self.debug = debug
         
+        # Per-cycle entry points, chosen once so the hot path has no
+        # debug checks
+        if debug:
+            self.clock_cycle = self._clock_cycle_debug
+            self._execute_signals = self._execute_signals_debug
+        else:
+            self.clock_cycle = self._clock_cycle_fast
+            self._execute_signals = self._execute_signals_fast
+        
+        # Generated handlers, filled in on first use of each ROM address or
+        # opcode; _compiled shares one function between identical words
+        self.handlers = [None] * len(self.cw_table)
+        self.opcode_handlers = [None] * 256
+        self._compiled = {}
+        
         # Statistics
         self.instruction_count = 0
         self.cycle_count = 0
         
         if debug:
             print("CPU initialized:")
-            print(f"  Microcode ROM: {len(microcode_rom)} bytes")
+            print(f"  Microcode ROM: {memoryview(microcode_rom).nbytes} bytes")
             print(f"  RAM: {len(self.ram)} bytes")
     
+    @staticmethod
+    def _build_cw_table(rom) -> array:
+        """
+        Build the control-word table from an array('H') or raw ROM bytes.
+        
+        The table has an entry for every (IR << 3) | step address an 8-bit
+        IR can form; addresses past the end of the ROM read as 0 (NOP).
+        """
+        if not isinstance(rom, array):
+            rom = _words_from_bytes(rom)
+        cw_table = rom[:256 << 3]
+        cw_table.extend([0] * ((256 << 3) - len(cw_table)))
+        return cw_table
+    
+    def _specialize(self, rom_addr: int):
+        """Compile, or reuse, the handler for a ROM address."""
+        cw = self.cw_table[rom_addr]
+        handler = self._compiled.get(cw)
+        if handler is None:
+            handler = self._compiled[cw] = _compile_handler(cw)
+        self.handlers[rom_addr] = handler
+        return handler
+    
+    def _specialize_opcode(self, opcode: int):
+        """Compile the whole-instruction handler for an opcode."""
+        handler = _compile_opcode_handler(opcode, self.cw_table)
+        self.opcode_handlers[opcode] = handler
+        return handler
+    
     def reset(self):
         """Reset CPU to initial state."""
         self.pc = 0
         self.mar = 0
         self.ir = 0
+        self._ir_base = 0
         self.a = 0
         self.b = 0
         self.flags = 0
@@ -140,16 +312,52 @@ class CPU:
         if self.debug:
             print("CPU reset")
     
+    def snapshot(self) -> int:
+        """
+        Pack the whole machine state into a single int.
+        
+        Layout (LSB first): PC:4 MAR:4 IR:8 A:8 B:8 FLAGS:8 micro_step:4
+        fetch_step:2 halted:1 fetching:1 BUS:8, then RAM from bit 56.
+        Statistics counters are not included.
+        """
+        return (self.pc
+                | self.mar << 4
+                | self.ir << 8
+                | self.a << 16
+                | self.b << 24
+                | self.flags << 32
+                | self.micro_step << 40
+                | self.fetch_step << 44
+                | self.halted << 46
+                | self.fetching << 47
+                | self.bus << 48
+                | int.from_bytes(self.ram, 'little') << 56)
+    
+    def restore(self, state: int):
+        """Restore machine state captured by snapshot()."""
+        self.pc = state & 0x0F
+        self.mar = (state >> 4) & 0x0F
+        self.ir = (state >> 8) & 0xFF
+        self._ir_base = self.ir << 3
+        self.a = (state >> 16) & 0xFF
+        self.b = (state >> 24) & 0xFF
+        self.flags = (state >> 32) & 0xFF
+        self.micro_step = (state >> 40) & 0x0F
+        self.fetch_step = (state >> 44) & 0x03
+        self.halted = bool((state >> 46) & 1)
+        self.fetching = bool((state >> 47) & 1)
+        self.bus = (state >> 48) & 0xFF
+        self.ram[:] = (state >> 56).to_bytes(len(self.ram), 'little')
+    
     def load_program(self, program: bytes, offset: int = 0):
         """Load program into RAM."""
-        for i, byte in enumerate(program):
-            if offset + i < len(self.ram):
-                self.ram[offset + i] = byte
+        n = max(0, min(len(program), len(self.ram) - offset))
+        self.ram[offset:offset + n] = program[:n]
         
         if self.debug:
             print(f"Loaded {len(program)} bytes at address {offset}")
     
-    def clock_cycle(self):
+    def _clock_cycle_fast(self):
         """
         Execute one clock cycle (one microcode step).
         This is called on each clock edge.
@@ -159,23 +367,17 @@ class CPU:
         
         # Handle fetch cycle first (2 steps)
         if self.fetching:
-            if self.debug:
-                print(f"\nCycle {self.cycle_count}: FETCH T{self.fetch_step}")
-            
             if self.fetch_step == 0:
                 # T0: PC -> MAR
                 self.bus = self.pc
                 self.mar = self.bus & 0x0F
-                if self.debug:
-                    print(f"  PC -> MAR: {self.mar}")
             
             elif self.fetch_step == 1:
                 # T1: RAM -> IR, PC++
                 self.bus = self.ram[self.mar]
                 self.ir = self.bus
+                self._ir_base = self.bus << 3
                 self.pc = (self.pc + 1) & 0x0F
-                if self.debug:
-                    print(f"  RAM[{self.mar}] -> IR: 0x{self.ir:02X}, PC++: {self.pc}")
                 
                 # Fetch complete, move to execute
                 self.fetching = False
@@ -183,133 +385,238 @@ class CPU:
             
             self.fetch_step += 1
             self.cycle_count += 1
-            
-            if self.debug:
-                self._print_state()
             return
         
         # Execute phase - use microcode ROM
         # Address = (instruction << 3) | micro_step
-        rom_addr = (self.ir << 3) | self.micro_step
+        rom_addr = self._ir_base | self.micro_step
         
-        # Read 16-bit control word (little-endian)
-        if rom_addr * 2 + 1 < len(self.microcode):
-            low_byte = self.microcode[rom_addr * 2]
-            high_byte = self.microcode[rom_addr * 2 + 1]
-            control_word = (high_byte << 8) | low_byte
-        else:
-            control_word = 0
+        handler = self.handlers[rom_addr]
+        if handler is None:
+            handler = self._specialize(rom_addr)
+        handler(self)
         
-        # Decode control signals
-        signals = ControlSignals.from_word(control_word)
+        # Advance micro-step
+        micro_step = self.micro_step + 1
+        if micro_step == 3:
+            # Back to T0, instruction complete - start new fetch
+            micro_step = 0
+            self.instruction_count += 1
+            self.fetching = True
+            self.fetch_step = 0
+        self.micro_step = micro_step
         
-        if self.debug:
-            print(f"\nCycle {self.cycle_count}: IR=0x{self.ir:02X} T{self.micro_step}")
-            print(f"  Signals: {signals}")
+        self.cycle_count += 1
+    
+    def _clock_cycle_debug(self):
+        """Execute one clock cycle, printing each step and the CPU state."""
+        if self.halted:
+            return
+        
+        # Handle fetch cycle first (2 steps)
+        if self.fetching:
+            print(f"\nCycle {self.cycle_count}: FETCH T{self.fetch_step}")
+            
+            if self.fetch_step == 0:
+                # T0: PC -> MAR
+                self.bus = self.pc
+                self.mar = self.bus & 0x0F
+                print(f"  PC -> MAR: {self.mar}")
+            
+            elif self.fetch_step == 1:
+                # T1: RAM -> IR, PC++
+                self.bus = self.ram[self.mar]
+                self.ir = self.bus
+                self._ir_base = self.bus << 3
+                self.pc = (self.pc + 1) & 0x0F
+                print(f"  RAM[{self.mar}] -> IR: 0x{self.ir:02X}, PC++: {self.pc}")
+                
+                # Fetch complete, move to execute
+                self.fetching = False
+                self.fetch_step = 0
+            
+            self.fetch_step += 1
+            self.cycle_count += 1
+            
+            self._print_state()
+            return
         
-        # Execute control signals
-        self._execute_signals(signals)
+        # Execute phase - use microcode ROM
+        rom_addr = self._ir_base | self.micro_step
+        control_word = self.cw_table[rom_addr]
+        print(f"\nCycle {self.cycle_count}: IR=0x{self.ir:02X} T{self.micro_step}")
+        print(f"  Signals: {describe_control_word(control_word)}")
+        self._execute_signals(control_word)
         
         # Advance micro-step
-        self.micro_step = (self.micro_step + 1) % 3
-        
-        # If back to T0, instruction complete - start new fetch
-        if self.micro_step == 0:
+        self.micro_step += 1
+        if self.micro_step == 3:
+            # Back to T0, instruction complete - start new fetch
+            self.micro_step = 0
             self.instruction_count += 1
             self.fetching = True
             self.fetch_step = 0
         
         self.cycle_count += 1
         
-        if self.debug:
-            self._print_state()
+        self._print_state()
     
-    def _execute_signals(self, signals: ControlSignals):
-        """Execute the active control signals."""
+    def _execute_signals_fast(self, cw: int):
+        """
+        Execute the active control signals of a 16-bit control word.
+        
+        Signals are tested directly as bits of the word and registers are
+        held in locals until the end of the step, so no per-cycle objects
+        are allocated.
+        """
+        # HALT signal
+        if cw & 0x2000:
+            self.halted = True
+            return
+        
+        ram = self.ram
+        pc = self.pc
+        mar = self.mar
+        a = self.a
+        b = self.b
+        bus = self.bus
+        
+        # Bus writes (multiple sources can write to bus)
+        if cw & 0x0001:  # PC_OUT
+            bus = pc & 0xFF
+        if cw & 0x0008:  # RAM_OUT
+            bus = ram[mar]
+        if cw & 0x0040:  # IR_OUT
+            bus = self.ir
+        if cw & 0x0100:  # A_OUT
+            bus = a
+        if cw & 0x0400:  # B_OUT
+            bus = b
+        
+        if cw & 0x0800:  # ALU_OUT
+            # ALU computes A +/- B
+            if cw & 0x1000:  # ALU_SUB
+                result = (a - b) & 0xFF
+                carry = a < b
+            else:
+                result = (a + b) & 0xFF
+                carry = (a + b) > 0xFF
+            
+            bus = result
+            
+            # Update flags if FLAGS_IN is also active
+            if cw & 0x4000:  # FLAGS_IN
+                self.flags = (carry << 0) | ((result == 0) << 1)
         
+        # Bus reads (registers/memory read from bus)
+        if cw & 0x0004:  # MAR_IN
+            mar = bus & 0x0F  # 4-bit address
+        if cw & 0x0010:  # RAM_IN
+            ram[mar] = bus
+        if cw & 0x0020:  # IR_IN
+            self.ir = bus
+            self._ir_base = bus << 3
+        if cw & 0x0080:  # A_IN
+            a = bus
+        if cw & 0x0200:  # B_IN
+            b = bus
+        
+        # PC increment
+        if cw & 0x0002:  # PC_INC
+            pc = (pc + 1) & 0x0F  # 4-bit counter
+        
+        self.pc = pc
+        self.mar = mar
+        self.a = a
+        self.b = b
+        self.bus = bus
+    
+    def _execute_signals_debug(self, cw: int):
+        """Execute a control word's signals, printing each transfer."""
         # HALT signal
-        if signals.HALT:
+        if cw & 0x2000:
             self.halted = True
-            if self.debug:
-                print("  ** HALTED **")
+            print("  ** HALTED **")
             return
         
+        ram = self.ram
+        pc = self.pc
+        mar = self.mar
+        a = self.a
+        b = self.b
+        bus = self.bus
+        
         # Bus writes (multiple sources can write to bus)
-        if signals.PC_OUT:
-            self.bus = self.pc & 0xFF
-            if self.debug:
-                print(f"  PC -> Bus: 0x{self.bus:02X}")
-        
-        if signals.RAM_OUT:
-            self.bus = self.ram[self.mar]
-            if self.debug:
-                print(f"  RAM[{self.mar}] -> Bus: 0x{self.bus:02X}")
-        
-        if signals.IR_OUT:
-            self.bus = self.ir
-            if self.debug:
-                print(f"  IR -> Bus: 0x{self.bus:02X}")
-        
-        if signals.A_OUT:
-            self.bus = self.a
-            if self.debug:
-                print(f"  A -> Bus: 0x{self.bus:02X}")
-        
-        if signals.B_OUT:
-            self.bus = self.b
-            if self.debug:
-                print(f"  B -> Bus: 0x{self.bus:02X}")
-        
-        if signals.ALU_OUT:
+        if cw & 0x0001:  # PC_OUT
+            bus = pc & 0xFF
+            print(f"  PC -> Bus: 0x{bus:02X}")
+        
+        if cw & 0x0008:  # RAM_OUT
+            bus = ram[mar]
+            print(f"  RAM[{mar}] -> Bus: 0x{bus:02X}")
+        
+        if cw & 0x0040:  # IR_OUT
+            bus = self.ir
+            print(f"  IR -> Bus: 0x{bus:02X}")
+        
+        if cw & 0x0100:  # A_OUT
+            bus = a
+            print(f"  A -> Bus: 0x{bus:02X}")
+        
+        if cw & 0x0400:  # B_OUT
+            bus = b
+            print(f"  B -> Bus: 0x{bus:02X}")
+        
+        if cw & 0x0800:  # ALU_OUT
             # ALU computes A +/- B
-            if signals.ALU_SUB:
-                result = (self.a - self.b) & 0xFF
-                carry = self.a < self.b
+            if cw & 0x1000:  # ALU_SUB
+                result = (a - b) & 0xFF
+                carry = a < b
             else:
-                result = (self.a + self.b) & 0xFF
-                carry = (self.a + self.b) > 0xFF
+                result = (a + b) & 0xFF
+                carry = (a + b) > 0xFF
             
-            self.bus = result
+            bus = result
             
             # Update flags if FLAGS_IN is also active
-            if signals.FLAGS_IN:
+            if cw & 0x4000:  # FLAGS_IN
                 self.flags = (carry << 0) | ((result == 0) << 1)
             
-            if self.debug:
-                op = "-" if signals.ALU_SUB else "+"
-                print(f"  ALU: A {op} B = 0x{result:02X} (C={carry}, Z={result==0})")
+            op = "-" if cw & 0x1000 else "+"
+            print(f"  ALU: A {op} B = 0x{result:02X} (C={carry}, Z={result==0})")
         
         # Bus reads (registers/memory read from bus)
-        if signals.MAR_IN:
-            self.mar = self.bus & 0x0F  # 4-bit address
-            if self.debug:
-                print(f"  Bus -> MAR: {self.mar}")
-        
-        if signals.RAM_IN:
-            self.ram[self.mar] = self.bus
-            if self.debug:
-                print(f"  Bus -> RAM[{self.mar}]: 0x{self.bus:02X}")
-        
-        if signals.IR_IN:
-            self.ir = self.bus
-            if self.debug:
-                print(f"  Bus -> IR: 0x{self.ir:02X}")
-        
-        if signals.A_IN:
-            self.a = self.bus
-            if self.debug:
-                print(f"  Bus -> A: 0x{self.a:02X}")
-        
-        if signals.B_IN:
-            self.b = self.bus
-            if self.debug:
-                print(f"  Bus -> B: 0x{self.b:02X}")
+        if cw & 0x0004:  # MAR_IN
+            mar = bus & 0x0F  # 4-bit address
+            print(f"  Bus -> MAR: {mar}")
+        
+        if cw & 0x0010:  # RAM_IN
+            ram[mar] = bus
+            print(f"  Bus -> RAM[{mar}]: 0x{bus:02X}")
+        
+        if cw & 0x0020:  # IR_IN
+            self.ir = bus
+            self._ir_base = bus << 3
+            print(f"  Bus -> IR: 0x{bus:02X}")
+        
+        if cw & 0x0080:  # A_IN
+            a = bus
+            print(f"  Bus -> A: 0x{a:02X}")
+        
+        if cw & 0x0200:  # B_IN
+            b = bus
+            print(f"  Bus -> B: 0x{b:02X}")
         
         # PC increment
-        if signals.PC_INC:
-            self.pc = (self.pc + 1) & 0x0F  # 4-bit counter
-            if self.debug:
-                print(f"  PC++: {self.pc}")
+        if cw & 0x0002:  # PC_INC
+            pc = (pc + 1) & 0x0F  # 4-bit counter
+            print(f"  PC++: {pc}")
+        
+        self.pc = pc
+        self.mar = mar
+        self.a = a
+        self.b = b
+        self.bus = bus
     
     def _print_state(self):
         """Print current CPU state."""
@@ -333,6 +640,54 @@ class CPU:
         
         return self.halted
     
+    def run_fast(self, max_cycles: int = 1000) -> bool:
+        """
+        Run CPU until halted or max cycles reached, without a Clock.
+        
+        Tight loop over a local reference to clock_cycle with no console
+        output. Under PyPy, let it warm up for a few thousand cycles before
+        timing it so the JIT has compiled the loop. When numba is installed
+        the whole loop runs natively via emulator.cpu_numba instead.
+        """
+        if cpu_numba is not None and not self.debug:
+            return cpu_numba.run_cpu(self, max_cycles)
+        
+        step = self.clock_cycle
+        
+        while not self.halted and self.cycle_count < max_cycles:
+            step()
+        
+        return self.halted
+    
+    def run_trace(self, max_cycles: int = 1000) -> bool:
+        """
+        Run CPU a whole instruction at a time using opcode_handlers.
+        
+        Bypasses the per-cycle fetch/execute bookkeeping; max_cycles is
+        checked between instructions, so the count may overshoot by up to
+        four cycles. With debug=True this falls back to the cycle-accurate
+        run_fast() so the trace output is unchanged.
+        """
+        if self.debug:
+            return self.run_fast(max_cycles)
+        
+        # Finish any partly executed instruction first
+        while (not self.halted and self.cycle_count < max_cycles
+               and not (self.fetching and self.fetch_step == 0)):
+            self.clock_cycle()
+        
+        handlers = self.opcode_handlers
+        ram = self.ram
+        
+        while not self.halted and self.cycle_count < max_cycles:
+            opcode = ram[self.pc]
+            handler = handlers[opcode]
+            if handler is None:
+                handler = self._specialize_opcode(opcode)
+            handler(self)
+        
+        return self.halted
+    
     def get_output(self) -> int:
         """Get value from register A (output register)."""
         return self.a
@@ -341,15 +696,25 @@ class CPU:
         """Print RAM contents."""
         print("\nRAM contents:")
         for i in range(0, len(self.ram), 8):
-            hex_values = " ".join(f"{b:02X}" for b in self.ram[i:i+8])
-            ascii_values = "".join(chr(b) if 32 <= b < 127 else "." for b in self.ram[i:i+8])
+            row = self.ram[i:i+8]
+            hex_values = row.hex(" ").upper()
+            ascii_values = row.translate(_PRINTABLE).decode("latin-1")
             print(f"  {i:X}: {hex_values}  {ascii_values}")
 
 
-def load_microcode(filepath: str) -> bytes:
-    """Load microcode ROM from binary file."""
+def _words_from_bytes(data: bytes) -> array:
+    """Decode little-endian ROM bytes into 16-bit words (odd byte dropped)."""
+    words = array('H')
+    words.frombytes(bytes(data[:len(data) & ~1]))
+    if sys.byteorder == 'big':
+        words.byteswap()
+    return words
+
+
+def load_microcode(filepath: str) -> array:
+    """Load microcode ROM from binary file as 16-bit control words."""
     with open(filepath, 'rb') as f:
-        return f.read()
+        return _words_from_bytes(f.read())
 
 
 if __name__ == '__main__':
@@ -360,7 +725,7 @@ if __name__ == '__main__':
     # Load microcode
     print("\n1. Loading microcode ROM...")
     microcode = load_microcode('microcode/microcode.bin')
-    print(f"   Loaded {len(microcode)} bytes")
+    print(f"   Loaded {len(microcode)} control words")
     
     # Create CPU
     cpu = CPU(microcode, debug=True)
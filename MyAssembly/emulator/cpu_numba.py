@@ -0,0 +1,190 @@
+"""
+Numba-compiled CPU inner loop
+
+Runs the same fetch/execute cycle as CPU.clock_cycle, but over a NumPy
+copy of the CPU state so Numba can compile the whole loop to native code.
+Requires numpy and numba; cpu.py falls back to pure Python without them.
+"""
+
+import numpy as np
+from numba import njit
+
+
+# Slots in the state vector
+PC = 0
+MAR = 1
+IR = 2
+A = 3
+B = 4
+BUS = 5
+FLAGS = 6
+MICRO_STEP = 7
+FETCHING = 8
+FETCH_STEP = 9
+HALTED = 10
+CYCLES = 11
+INSTRUCTIONS = 12
+STATE_SIZE = 13
+
+
+@njit(cache=True)
+def run(ram, cw_table, state, max_cycles):
+    """
+    Run until halted or max_cycles, updating ram and state in place.
+
+    Args:
+        ram: np.uint8 array, CPU RAM
+        cw_table: np.uint16 array, control word per ROM address
+        state: np.int64 array of STATE_SIZE registers and counters
+        max_cycles: stop once the cycle count reaches this
+
+    Returns:
+        True if the CPU halted
+    """
+    pc = state[PC]
+    mar = state[MAR]
+    ir = state[IR]
+    a = state[A]
+    b = state[B]
+    bus = state[BUS]
+    flags = state[FLAGS]
+    micro_step = state[MICRO_STEP]
+    fetching = state[FETCHING]
+    fetch_step = state[FETCH_STEP]
+    halted = state[HALTED]
+    cycles = state[CYCLES]
+    instructions = state[INSTRUCTIONS]
+
+    while halted == 0 and cycles < max_cycles:
+        # Fetch cycle (2 steps)
+        if fetching != 0:
+            if fetch_step == 0:
+                # T0: PC -> MAR
+                bus = pc
+                mar = bus & 0x0F
+            elif fetch_step == 1:
+                # T1: RAM -> IR, PC++
+                bus = np.int64(ram[mar])
+                ir = bus
+                pc = (pc + 1) & 0x0F
+                fetching = 0
+                fetch_step = 0
+
+            fetch_step += 1
+            cycles += 1
+            continue
+
+        # Execute phase
+        cw = np.int64(cw_table[(ir << 3) | micro_step])
+
+        if cw & 0x2000:  # HALT
+            halted = 1
+        else:
+            # Bus writes
+            if cw & 0x0001:  # PC_OUT
+                bus = pc & 0xFF
+            if cw & 0x0008:  # RAM_OUT
+                bus = np.int64(ram[mar])
+            if cw & 0x0040:  # IR_OUT
+                bus = ir
+            if cw & 0x0100:  # A_OUT
+                bus = a
+            if cw & 0x0400:  # B_OUT
+                bus = b
+            if cw & 0x0800:  # ALU_OUT
+                if cw & 0x1000:  # ALU_SUB
+                    result = a - b
+                    carry = 1 if result < 0 else 0
+                else:
+                    result = a + b
+                    carry = 1 if result > 0xFF else 0
+                bus = result & 0xFF
+                if cw & 0x4000:  # FLAGS_IN
+                    flags = carry | ((1 if bus == 0 else 0) << 1)
+
+            # Bus reads
+            if cw & 0x0004:  # MAR_IN
+                mar = bus & 0x0F
+            if cw & 0x0010:  # RAM_IN
+                ram[mar] = bus
+            if cw & 0x0020:  # IR_IN
+                ir = bus
+            if cw & 0x0080:  # A_IN
+                a = bus
+            if cw & 0x0200:  # B_IN
+                b = bus
+
+            # PC increment
+            if cw & 0x0002:  # PC_INC
+                pc = (pc + 1) & 0x0F
+
+        # Advance micro-step
+        micro_step += 1
+        if micro_step == 3:
+            micro_step = 0
+            instructions += 1
+            fetching = 1
+            fetch_step = 0
+
+        cycles += 1
+
+    state[PC] = pc
+    state[MAR] = mar
+    state[IR] = ir
+    state[A] = a
+    state[B] = b
+    state[BUS] = bus
+    state[FLAGS] = flags
+    state[MICRO_STEP] = micro_step
+    state[FETCHING] = fetching
+    state[FETCH_STEP] = fetch_step
+    state[HALTED] = halted
+    state[CYCLES] = cycles
+    state[INSTRUCTIONS] = instructions
+
+    return halted != 0
+
+
+def run_cpu(cpu, max_cycles: int) -> bool:
+    """
+    Run a CPU instance through the compiled loop.
+
+    Copies RAM and registers into NumPy buffers, runs, and copies back.
+    """
+    ram = np.frombuffer(bytes(cpu.ram), dtype=np.uint8).copy()
+    cw_table = np.frombuffer(cpu.cw_table, dtype=np.uint16)
+
+    state = np.zeros(STATE_SIZE, dtype=np.int64)
+    state[PC] = cpu.pc
+    state[MAR] = cpu.mar
+    state[IR] = cpu.ir
+    state[A] = cpu.a
+    state[B] = cpu.b
+    state[BUS] = cpu.bus
+    state[FLAGS] = cpu.flags
+    state[MICRO_STEP] = cpu.micro_step
+    state[FETCHING] = cpu.fetching
+    state[FETCH_STEP] = cpu.fetch_step
+    state[HALTED] = cpu.halted
+    state[CYCLES] = cpu.cycle_count
+    state[INSTRUCTIONS] = cpu.instruction_count
+
+    halted = run(ram, cw_table, state, max_cycles)
+
+    cpu.ram[:] = ram.tobytes()
+    cpu.pc = int(state[PC])
+    cpu.mar = int(state[MAR])
+    cpu.ir = int(state[IR])
+    cpu._ir_base = cpu.ir << 3
+    cpu.a = int(state[A])
+    cpu.b = int(state[B])
+    cpu.bus = int(state[BUS])
+    cpu.flags = int(state[FLAGS])
+    cpu.micro_step = int(state[MICRO_STEP])
+    cpu.fetching = bool(state[FETCHING])
+    cpu.fetch_step = int(state[FETCH_STEP])
+    cpu.halted = bool(state[HALTED])
+    cpu.cycle_count = int(state[CYCLES])
+    cpu.instruction_count = int(state[INSTRUCTIONS])
+
+    return bool(halted)
@@ -8,17 +8,89 @@ Outputs in multiple formats:
 - .lst: Symbolic listing (human-readable debug format)
 """
 
+import functools
+import hashlib
+import json
+import os
 import yaml
+import struct
 import sys
+import tempfile
 from pathlib import Path
 
+try:
+    from yaml import CSafeLoader as _YamlLoader  # libyaml C parser
+except ImportError:
+    from yaml import SafeLoader as _YamlLoader
+
+
+def load_spec(spec_file) -> dict:
+    """
+    Load a microcode spec, reusing earlier parses where possible.
+    
+    Within a process, the result is cached per path and modification time.
+    Across runs, the parsed spec is kept in a JSON sidecar next to the spec
+    (spec.yml.cache.json), keyed by the SHA-256 of the YAML source, since
+    JSON loads far faster than YAML parses.
+    """
+    path = str(spec_file)
+    return _load_spec_cached(path, os.stat(path).st_mtime_ns)
+
+
+@functools.lru_cache(maxsize=None)
+def _load_spec_cached(path: str, mtime_ns: int) -> dict:
+    """Load a spec file; the mtime argument only keys the cache."""
+    with open(path, 'rb') as f:
+        data = f.read()
+    
+    digest = hashlib.sha256(data).hexdigest()
+    cache_file = path + '.cache.json'
+    
+    try:
+        with open(cache_file, 'r') as f:
+            if f.readline().rstrip('\n') == digest:
+                return _spec_from_json(json.load(f))
+    except (OSError, ValueError):
+        pass  # Missing or unreadable cache: parse the YAML
+    
+    spec = yaml.load(data, Loader=_YamlLoader)
+    
+    # Write the cache atomically; failing to write it is not an error, but
+    # the temporary file must not be left next to the spec
+    tmp_file = None
+    try:
+        with tempfile.NamedTemporaryFile('w', dir=os.path.dirname(cache_file) or '.',
+                                         prefix=os.path.basename(cache_file),
+                                         suffix='.tmp', delete=False) as f:
+            tmp_file = f.name
+            f.write(digest + '\n')
+            json.dump(_spec_to_json(spec), f)
+        os.replace(tmp_file, cache_file)
+    except (OSError, TypeError, ValueError):
+        if tmp_file is not None:
+            try:
+                os.unlink(tmp_file)
+            except OSError:
+                pass
+    
+    return spec
+
+
+def _spec_to_json(spec: dict) -> dict:
+    """Store instructions as [opcode, body] pairs so int opcodes survive JSON."""
+    return {**spec, 'instructions': list(spec['instructions'].items())}
+
+
+def _spec_from_json(data: dict) -> dict:
+    """Inverse of _spec_to_json."""
+    return {**data, 'instructions': {opcode: body for opcode, body in data['instructions']}}
+
 
 class MicrocodeGenerator:
     """Generate microcode ROM from specification."""
     
     def __init__(self, spec_file):
-        with open(spec_file, 'r') as f:
-            self.spec = yaml.safe_load(f)
+        self.spec = load_spec(spec_file)
         
         self.control_signals = self.spec['control_signals']
         self.instructions = self.spec['instructions']
@@ -26,11 +98,19 @@ class MicrocodeGenerator:
         
         # Initialize ROM
         self.rom = bytearray(256)
+        
+        # Control word for each signal string seen, e.g. "PC_OUT | MAR_IN"
+        self._control_word_cache = {}
     
     def parse_control_word(self, signals):
         """Convert signal names to control word value."""
         if isinstance(signals, str):
-            signals = [s.strip() for s in signals.split('|')]
+            control_word = self._control_word_cache.get(signals)
+            if control_word is None:
+                control_word = self.parse_control_word(
+                    [s.strip() for s in signals.split('|')])
+                self._control_word_cache[signals] = control_word
+            return control_word
         elif isinstance(signals, int):
             return signals
         
@@ -68,8 +148,7 @@ class MicrocodeGenerator:
                 
                 # Store as 16-bit little-endian
                 if addr * 2 + 1 < len(rom):
-                    rom[addr * 2] = control_word & 0xFF          # Low byte
-                    rom[addr * 2 + 1] = (control_word >> 8) & 0xFF  # High byte
+                    struct.pack_into('<H', rom, addr * 2, control_word & 0xFFFF)
         
         self.rom = rom
         return rom
@@ -86,20 +165,18 @@ class MicrocodeGenerator:
         
         # Data records (16 bytes per line)
         for addr in range(0, len(self.rom), 16):
-            chunk = self.rom[addr:addr+16]
+            chunk = bytes(self.rom[addr:addr+16])
             byte_count = len(chunk)
             record_type = 0x00  # Data record
             
             # Calculate checksum
             checksum = byte_count + (addr >> 8) + (addr & 0xFF) + record_type
             checksum += sum(chunk)
-            checksum = (~checksum + 1) & 0xFF
+            checksum = -checksum & 0xFF
             
             # Format line
-            line = f":{byte_count:02X}{addr:04X}{record_type:02X}"
-            line += ''.join(f"{b:02X}" for b in chunk)
-            line += f"{checksum:02X}"
-            lines.append(line)
+            lines.append(f":{byte_count:02X}{addr:04X}{record_type:02X}"
+                         f"{chunk.hex().upper()}{checksum:02X}")
         
         # End-of-file record
         lines.append(":00000001FF")
@@ -124,6 +201,9 @@ class MicrocodeGenerator:
             lines.append(f"  {name:12s} = 0x{value:04X}")
         lines.append("")
         
+        # Signal name for each single-bit control signal
+        bit_to_name = {value: name for name, value in self.control_signals.items()}
+        
         # Instruction microcode
         lines.append("Instruction Microcode:")
         lines.append("=" * 80)
@@ -142,11 +222,13 @@ class MicrocodeGenerator:
                 addr = (opcode << 3) | step_num
                 control_word = self.parse_control_word(step_signals)
                 
-                # Decode signals
+                # Decode signals, visiting only the set bits (lowest first)
                 active_signals = []
-                for sig_name, sig_value in self.control_signals.items():
-                    if control_word & sig_value:
-                        active_signals.append(sig_name)
+                cw = control_word
+                while cw:
+                    low = cw & -cw
+                    active_signals.append(bit_to_name.get(low, f"bit{low.bit_length() - 1}"))
+                    cw ^= low
                 
                 signals_str = ' | '.join(active_signals) if active_signals else 'NOP'
                 lines.append(f"  T{step_num}: [0x{addr:03X}] 0x{control_word:04X}  {signals_str}")
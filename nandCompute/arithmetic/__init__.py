@@ -1,13 +1,13 @@
 """Arithmetic module - Adders and ALU."""
 
 from .adder import (
-    half_adder, full_adder, add_n, increment_n, 
+    half_adder, full_adder, add_n, add_n_gates, increment_n, 
     negate_n, sub_n, zero_n, negative_n
 )
 from .alu import ALU, ALU_OPS, ALU_OP_NAMES
 
 __all__ = [
-    'half_adder', 'full_adder', 'add_n', 'increment_n',
+    'half_adder', 'full_adder', 'add_n', 'add_n_gates', 'increment_n',
     'negate_n', 'sub_n', 'zero_n', 'negative_n',
     'ALU', 'ALU_OPS', 'ALU_OP_NAMES'
 ]
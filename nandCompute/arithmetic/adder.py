@@ -5,9 +5,10 @@ Building binary arithmetic from logic gates.
 """
 
 import sys
+from collections.abc import Sequence
 sys.path.append('..')
 
-from logic import AND, OR, XOR, NOT, NOT_n, AND_n, OR_n
+from logic import AND, OR, XOR, bits_to_int, int_to_bits
 
 
 def half_adder(a: bool, b: bool) -> tuple[bool, bool]:
@@ -52,7 +53,7 @@ def full_adder(a: bool, b: bool, carry_in: bool) -> tuple[bool, bool]:
     return (sum_out, carry_out)
 
 
-def add_n(a: list[bool], b: list[bool]) -> list[bool]:
+def add_n(a: Sequence[bool], b: Sequence[bool]) -> list[bool]:
     """
     N-bit ripple carry adder.
     
@@ -60,6 +61,22 @@ def add_n(a: list[bool], b: list[bool]) -> list[bool]:
     LSB is at index 0.
     
     Returns: n+1 bits (result with potential overflow bit)
+    
+    Gives the same result as chaining full_adder() across the bits
+    (see add_n_gates), but adds the operands as integers in one step.
+    """
+    n = len(a)
+    assert len(b) == n, "Both inputs must be same length"
+    
+    return int_to_bits(bits_to_int(a) + bits_to_int(b), n + 1)
+
+
+def add_n_gates(a: Sequence[bool], b: Sequence[bool]) -> list[bool]:
+    """
+    N-bit ripple carry adder built from full adders.
+    
+    The gate-level reference for add_n: one full_adder per bit, with
+    each carry rippling into the next.
     """
     n = len(a)
     assert len(b) == n, "Both inputs must be same length"
@@ -77,30 +94,29 @@ def add_n(a: list[bool], b: list[bool]) -> list[bool]:
     return result
 
 
-def increment_n(a: list[bool]) -> list[bool]:
+def increment_n(a: Sequence[bool]) -> list[bool]:
     """
     Increment an n-bit number by 1.
     
     This is useful for the program counter.
     """
     n = len(a)
-    one = [True] + [False] * (n - 1)  # Binary 1
-    return add_n(a, one)[:n]  # Discard overflow
+    mask = (1 << n) - 1  # Discard overflow
+    return int_to_bits((bits_to_int(a) + 1) & mask, n)
 
 
-def negate_n(a: list[bool]) -> list[bool]:
+def negate_n(a: Sequence[bool]) -> list[bool]:
     """
     Two's complement negation of n-bit number.
     
     -a = NOT(a) + 1
     """
     n = len(a)
-    not_a = NOT_n(a)
-    one = [True] + [False] * (n - 1)
-    return add_n(not_a, one)[:n]  # Discard overflow
+    mask = (1 << n) - 1
+    return int_to_bits((~bits_to_int(a) + 1) & mask, n)
 
 
-def sub_n(a: list[bool], b: list[bool]) -> list[bool]:
+def sub_n(a: Sequence[bool], b: Sequence[bool]) -> list[bool]:
     """
     N-bit subtraction: a - b
     
@@ -109,23 +125,21 @@ def sub_n(a: list[bool], b: list[bool]) -> list[bool]:
     n = len(a)
     assert len(b) == n, "Both inputs must be same length"
     
-    neg_b = negate_n(b)
-    return add_n(a, neg_b)[:n]  # Discard overflow
+    mask = (1 << n) - 1
+    return int_to_bits((bits_to_int(a) - bits_to_int(b)) & mask, n)
 
 
-def zero_n(bits: list[bool]) -> bool:
+def zero_n(bits: Sequence[bool]) -> bool:
     """
     Check if n-bit number is zero.
     
-    Returns True if all bits are False.
+    Returns True if all bits are False. Equivalent to NOT of the OR of
+    every bit; any() evaluates that OR in C and stops at the first 1.
     """
-    result = bits[0]
-    for bit in bits[1:]:
-        result = OR(result, bit)
-    return NOT(result)
+    return not any(bits)
 
 
-def negative_n(bits: list[bool]) -> bool:
+def negative_n(bits: Sequence[bool]) -> bool:
     """
     Check if n-bit two's complement number is negative.
     
@@ -158,14 +172,6 @@ if __name__ == "__main__":
     # Test 8-bit addition
     print("\n8-bit Addition Examples:")
     
-    def bits_to_int(bits):
-        """Convert bit list to integer (unsigned)."""
-        return sum(b << i for i, b in enumerate(bits))
-    
-    def int_to_bits(value, n=8):
-        """Convert integer to n-bit list."""
-        return [(value >> i) & 1 for i in range(n)]
-    
     test_cases = [
         (5, 3),
         (15, 1),
@@ -174,8 +180,8 @@ if __name__ == "__main__":
     ]
     
     for a_val, b_val in test_cases:
-        a_bits = int_to_bits(a_val)
-        b_bits = int_to_bits(b_val)
+        a_bits = int_to_bits(a_val, 8)
+        b_bits = int_to_bits(b_val, 8)
         result = add_n(a_bits, b_bits)
         result_val = bits_to_int(result)
         
@@ -184,8 +190,8 @@ if __name__ == "__main__":
     # Test subtraction
     print("\n8-bit Subtraction Examples:")
     for a_val, b_val in test_cases:
-        a_bits = int_to_bits(a_val)
-        b_bits = int_to_bits(b_val)
+        a_bits = int_to_bits(a_val, 8)
+        b_bits = int_to_bits(b_val, 8)
         result = sub_n(a_bits, b_bits)
         result_val = bits_to_int(result)
         
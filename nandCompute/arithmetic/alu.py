@@ -6,10 +6,26 @@ This is the computational heart of the CPU.
 """
 
 import sys
+from collections.abc import Sequence
 sys.path.append('..')
 
-from logic import AND_n, OR_n, XOR_n, NOT_n, MUX_n
-from .adder import add_n, sub_n, zero_n, negative_n
+from logic import bits_to_int, int_to_bits
+from .adder import negative_n
+
+
+# Operation per opcode on n-bit unsigned ints, indexed by opcode
+# (see ALU.compute_int); mask is (1 << n_bits) - 1
+_ALU_FUNCS = (
+    lambda a, b, mask: (a + b) & mask,   # 0: ADD
+    lambda a, b, mask: (a - b) & mask,   # 1: SUB
+    lambda a, b, mask: a & b,            # 2: AND
+    lambda a, b, mask: a | b,            # 3: OR
+    lambda a, b, mask: a ^ b,            # 4: XOR
+    lambda a, b, mask: ~a & mask,        # 5: NOT
+    lambda a, b, mask: a,                # 6: PASS_A
+    lambda a, b, mask: b,                # 7: PASS_B
+    lambda a, b, mask: 0,                # 8: ZERO
+)
 
 
 class ALU:
@@ -26,22 +42,36 @@ class ALU:
     - PASS_A: output = a
     - PASS_B: output = b
     - ZERO: output = 0
+    
+    Operands and output are held as n-bit unsigned ints. compute() takes
+    and returns bit lists; compute_int() works on the ints directly.
     """
     
+    __slots__ = ('n_bits', 'a', 'b', 'output', 'zero_flag', 'negative_flag')
+    
     def __init__(self, n_bits=8):
         self.n_bits = n_bits
-        self.a = [False] * n_bits
-        self.b = [False] * n_bits
-        self.output = [False] * n_bits
+        self.a = 0
+        self.b = 0
+        self.output = 0
         self.zero_flag = False
         self.negative_flag = False
     
-    def compute(self, a: list[bool], b: list[bool], opcode: int) -> list[bool]:
+    @staticmethod
+    def from_bits(bits: Sequence[bool]) -> int:
+        """Convert a bit list (LSB at index 0) to an unsigned int."""
+        return bits_to_int(bits)
+    
+    def to_bits(self, value: int) -> list[bool]:
+        """Convert an int to an n_bits-long bit list (LSB at index 0)."""
+        return int_to_bits(value, self.n_bits)
+    
+    def compute(self, a: Sequence[bool], b: Sequence[bool], opcode: int) -> list[bool]:
         """
         Perform ALU operation.
         
         Args:
-            a: First operand (n-bit)
+            a: First operand (n-bit; bools or 0/1 ints, e.g. array('B'))
             b: Second operand (n-bit)
             opcode: Operation code (0-8)
                 0: ADD
@@ -59,36 +89,33 @@ class ALU:
         """
         assert len(a) == self.n_bits and len(b) == self.n_bits
         
+        return self.to_bits(self.compute_int(bits_to_int(a), bits_to_int(b), opcode))
+    
+    def compute_int(self, a: int, b: int, opcode: int) -> int:
+        """
+        Perform ALU operation on n-bit unsigned ints.
+        
+        Same opcodes and flags as compute(). Operands are masked to n_bits,
+        as the fixed width of the bit lists does in compute().
+        """
+        n_bits = self.n_bits
+        mask = (1 << n_bits) - 1
+        a &= mask
+        b &= mask
+        
         self.a = a
         self.b = b
         
         # Perform operation based on opcode
-        if opcode == 0:  # ADD
-            result = add_n(a, b)[:self.n_bits]
-        elif opcode == 1:  # SUB
-            result = sub_n(a, b)
-        elif opcode == 2:  # AND
-            result = AND_n(a, b)
-        elif opcode == 3:  # OR
-            result = OR_n(a, b)
-        elif opcode == 4:  # XOR
-            result = XOR_n(a, b)
-        elif opcode == 5:  # NOT
-            result = NOT_n(a)
-        elif opcode == 6:  # PASS_A
-            result = a[:]
-        elif opcode == 7:  # PASS_B
-            result = b[:]
-        elif opcode == 8:  # ZERO
-            result = [False] * self.n_bits
-        else:
+        if not 0 <= opcode < len(_ALU_FUNCS):
             raise ValueError(f"Invalid opcode: {opcode}")
+        result = _ALU_FUNCS[opcode](a, b, mask)
         
         self.output = result
         
         # Set flags
-        self.zero_flag = zero_n(result)
-        self.negative_flag = negative_n(result)
+        self.zero_flag = result == 0
+        self.negative_flag = bool((result >> (n_bits - 1)) & 1)
         
         return result
     
@@ -101,9 +128,7 @@ class ALU:
     
     def __repr__(self):
         """String representation of ALU state."""
-        a_val = sum(b << i for i, b in enumerate(self.a))
-        b_val = sum(b << i for i, b in enumerate(self.b))
-        out_val = sum(b << i for i, b in enumerate(self.output))
+        a_val, b_val, out_val = self.a, self.b, self.output
         
         return (f"ALU({self.n_bits}-bit)\n"
                 f"  A = {a_val:3d} (0x{a_val:02X})\n"
@@ -131,14 +156,6 @@ ALU_OP_NAMES = {v: k for k, v in ALU_OPS.items()}
 if __name__ == "__main__":
     print("ALU (Arithmetic Logic Unit)\n")
     
-    def int_to_bits(value, n=8):
-        """Convert integer to n-bit list."""
-        return [bool((value >> i) & 1) for i in range(n)]
-    
-    def bits_to_int(bits):
-        """Convert bit list to integer."""
-        return sum(b << i for i, b in enumerate(bits))
-    
     def signed_value(bits):
         """Interpret as two's complement signed integer."""
         val = bits_to_int(bits)
@@ -165,8 +182,8 @@ if __name__ == "__main__":
     print("=" * 60)
     
     for a_val, b_val, op_name in test_cases:
-        a_bits = int_to_bits(a_val)
-        b_bits = int_to_bits(b_val)
+        a_bits = int_to_bits(a_val, 8)
+        b_bits = int_to_bits(b_val, 8)
         
         result = alu.compute(a_bits, b_bits, ALU_OPS[op_name])
         result_val = bits_to_int(result)
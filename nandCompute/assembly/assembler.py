@@ -5,8 +5,10 @@ This assembler translates our assembly language into 16-bit machine code
 that can be executed by our virtual machine.
 """
 
-import re
+import functools
 import sys
+from array import array
+from itertools import compress
 from typing import List, Tuple, Dict
 
 # Opcode mapping
@@ -29,15 +31,76 @@ OPCODES = {
     'OUT':   0xF,
 }
 
+# OPCODES plus lower-case spellings, so most lines need no upper() call
+OPCODES_CI = {**OPCODES, **{name.lower(): opcode for name, opcode in OPCODES.items()}}
+
+
+def _operand_format(opcode: int) -> str:
+    """Operand template used by Assembler.disassemble for an opcode."""
+    if opcode in [0x1, 0x2, 0x3, 0xC, 0xD, 0xE]:
+        return "R{rd}, {imm}"
+    elif opcode in [0x6, 0x7, 0xF]:
+        return "R{rd}"
+    elif opcode == 0xB:
+        return "R{rd}, R{rs1}"
+    else:
+        return "R{rd}, R{rs1}, R{rs2}"
+
+
+# Disassembly template per opcode, e.g. "LOADI R{rd}, {imm}"
+DISASM_FORMATS = {opcode: f"{name} {_operand_format(opcode)}"
+                  for name, opcode in OPCODES.items()}
+
+
+@functools.lru_cache(maxsize=4096)
+def _parse_numeric(imm_str: str) -> int:
+    """Parse a numeric literal (decimal, hex, or binary); cached per string."""
+    try:
+        if imm_str.startswith('0x') or imm_str.startswith('0X'):
+            return int(imm_str, 16)
+        elif imm_str.startswith('0b') or imm_str.startswith('0B'):
+            return int(imm_str, 2)
+        else:
+            return int(imm_str)
+    except ValueError:
+        raise ValueError(f"Invalid immediate value: {imm_str}")
+
 
 class Assembler:
     """Assembles assembly language to machine code."""
     
+    __slots__ = ('labels', 'current_address', 'output', 'data_section',
+                 '_parsed', '_handlers')
+    
     def __init__(self):
         self.labels: Dict[str, int] = {}
         self.current_address = 0
-        self.instructions: List[Tuple[int, int]] = []  # (address, instruction)
+        self.output = array('H')  # Machine word per address, 0 where unused
         self.data_section: List[Tuple[int, int]] = []  # (address, value)
+        self._parsed: List[Tuple[str, str, int]] = []  # (kind, payload, line)
+        
+        # Operand encoder for each mnemonic, in upper and lower case
+        # (see assemble_line)
+        self._handlers = {
+            'HALT': self._enc_none,
+            'LOADI': self._enc_reg_imm,
+            'LOAD': self._enc_reg_imm,
+            'STORE': self._enc_reg_imm,
+            'ADD': self._enc_rrr,
+            'SUB': self._enc_rrr,
+            'AND': self._enc_rrr,
+            'OR': self._enc_rrr,
+            'XOR': self._enc_rrr,
+            'INC': self._enc_reg,
+            'DEC': self._enc_reg,
+            'NOT': self._enc_rr,
+            'JMP': self._enc_imm,
+            'JZ': self._enc_reg_imm,
+            'JNZ': self._enc_reg_imm,
+            'OUT': self._enc_reg,
+        }
+        self._handlers.update({name.lower(): handler
+                               for name, handler in self._handlers.items()})
     
     def parse_register(self, reg_str: str) -> int:
         """Parse register name (R0-R7) to register number."""
@@ -62,15 +125,7 @@ class Assembler:
             return self.labels[imm_str]
         
         # Parse as number (decimal, hex, or binary)
-        try:
-            if imm_str.startswith('0x') or imm_str.startswith('0X'):
-                return int(imm_str, 16)
-            elif imm_str.startswith('0b') or imm_str.startswith('0B'):
-                return int(imm_str, 2)
-            else:
-                return int(imm_str)
-        except ValueError:
-            raise ValueError(f"Invalid immediate value: {imm_str}")
+        return _parse_numeric(imm_str)
     
     def encode_instruction(self, opcode: int, rd: int = 0, rs1: int = 0, 
                           rs2: int = 0, imm: int = 0) -> int:
@@ -100,72 +155,72 @@ class Assembler:
             return None
         
         # Split into parts
-        parts = re.split(r'[,\s]+', line)
-        instruction = parts[0].upper()
-        
-        if instruction not in OPCODES:
-            raise ValueError(f"Unknown instruction: {instruction}")
+        parts = line.replace(',', ' ').split()
+        instruction = parts[0]
+        opcode = OPCODES_CI.get(instruction)
         
-        opcode = OPCODES[instruction]
+        if opcode is None:
+            # Mixed case (e.g. "Halt"): fall back to upper-casing
+            instruction = instruction.upper()
+            if instruction not in OPCODES:
+                raise ValueError(f"Unknown instruction: {instruction}")
+            opcode = OPCODES[instruction]
         
         # Encode based on instruction type
-        if instruction == 'HALT':
-            return (address, self.encode_instruction(opcode))
-        
-        elif instruction == 'LOADI':
-            # LOADI Rd, imm
-            rd = self.parse_register(parts[1])
-            imm = self.parse_immediate(parts[2])
-            return (address, self.encode_instruction(opcode, rd=rd, imm=imm))
-        
-        elif instruction in ['LOAD', 'STORE']:
-            # LOAD/STORE Rd, addr
-            rd = self.parse_register(parts[1])
-            addr = self.parse_immediate(parts[2])
-            return (address, self.encode_instruction(opcode, rd=rd, imm=addr))
-        
-        elif instruction in ['ADD', 'SUB', 'AND', 'OR', 'XOR']:
-            # ADD Rd, Rs1, Rs2
-            rd = self.parse_register(parts[1])
-            rs1 = self.parse_register(parts[2])
-            rs2 = self.parse_register(parts[3])
-            return (address, self.encode_instruction(opcode, rd=rd, rs1=rs1, rs2=rs2))
-        
-        elif instruction in ['INC', 'DEC']:
-            # INC Rd
-            rd = self.parse_register(parts[1])
-            return (address, self.encode_instruction(opcode, rd=rd))
-        
-        elif instruction == 'NOT':
-            # NOT Rd, Rs
-            rd = self.parse_register(parts[1])
-            rs1 = self.parse_register(parts[2])
-            return (address, self.encode_instruction(opcode, rd=rd, rs1=rs1))
-        
-        elif instruction == 'JMP':
-            # JMP addr
-            addr = self.parse_immediate(parts[1])
-            return (address, self.encode_instruction(opcode, imm=addr))
-        
-        elif instruction in ['JZ', 'JNZ']:
-            # JZ Rs, addr
-            rs = self.parse_register(parts[1])
-            addr = self.parse_immediate(parts[2])
-            return (address, self.encode_instruction(opcode, rd=rs, imm=addr))
-        
-        elif instruction == 'OUT':
-            # OUT Rs
-            rs = self.parse_register(parts[1])
-            return (address, self.encode_instruction(opcode, rd=rs))
-        
-        else:
+        handler = self._handlers.get(instruction)
+        if handler is None:
             raise ValueError(f"Unimplemented instruction: {instruction}")
+        
+        return (address, handler(opcode, parts))
     
-    def first_pass(self, lines: List[str]):
-        """First pass: collect labels and calculate addresses."""
-        address = 0
+    # Operand encoders used by assemble_line, one per instruction format.
+    # Each takes the opcode and the split line and returns the machine word.
+    
+    def _enc_none(self, opcode: int, parts: List[str]) -> int:
+        # HALT
+        return self.encode_instruction(opcode)
+    
+    def _enc_reg_imm(self, opcode: int, parts: List[str]) -> int:
+        # LOADI Rd, imm / LOAD, STORE Rd, addr / JZ, JNZ Rs, addr
+        rd = self.parse_register(parts[1])
+        imm = self.parse_immediate(parts[2])
+        return self.encode_instruction(opcode, rd=rd, imm=imm)
+    
+    def _enc_rrr(self, opcode: int, parts: List[str]) -> int:
+        # ADD Rd, Rs1, Rs2
+        rd = self.parse_register(parts[1])
+        rs1 = self.parse_register(parts[2])
+        rs2 = self.parse_register(parts[3])
+        return self.encode_instruction(opcode, rd=rd, rs1=rs1, rs2=rs2)
+    
+    def _enc_reg(self, opcode: int, parts: List[str]) -> int:
+        # INC Rd / OUT Rs
+        rd = self.parse_register(parts[1])
+        return self.encode_instruction(opcode, rd=rd)
+    
+    def _enc_rr(self, opcode: int, parts: List[str]) -> int:
+        # NOT Rd, Rs
+        rd = self.parse_register(parts[1])
+        rs1 = self.parse_register(parts[2])
+        return self.encode_instruction(opcode, rd=rd, rs1=rs1)
+    
+    def _enc_imm(self, opcode: int, parts: List[str]) -> int:
+        # JMP addr
+        addr = self.parse_immediate(parts[1])
+        return self.encode_instruction(opcode, imm=addr)
+    
+    def parse_lines(self, lines: List[str]) -> List[Tuple[str, str, int]]:
+        """
+        Tokenize source lines once for both passes.
+        
+        Returns (kind, payload, line_num) entries, where kind is 'org'
+        (payload: address operand), 'data', 'label' (payload: label name)
+        or 'instr' (payload: line without comment). Blank and comment-only
+        lines are dropped.
+        """
+        parsed = []
         
-        for line in lines:
+        for line_num, line in enumerate(lines, 1):
             # Remove comments
             line = line.split(';')[0].strip()
             
@@ -174,84 +229,79 @@ class Assembler:
             
             # Check for directives
             if line.startswith('.ORG'):
-                # Set origin address
-                parts = line.split()
-                address = self.parse_immediate(parts[1])
-                self.current_address = address
-                continue
+                parsed.append(('org', line.split()[1], line_num))
+            elif line.startswith('.DATA'):
+                parsed.append(('data', line, line_num))
+            elif line.endswith(':'):
+                parsed.append(('label', line[:-1].strip(), line_num))
+            else:
+                parsed.append(('instr', line, line_num))
+        
+        return parsed
+    
+    def first_pass(self, parsed: List[Tuple[str, str, int]]):
+        """First pass: collect labels and calculate addresses."""
+        address = 0
+        
+        for kind, payload, _ in parsed:
+            if kind == 'instr':
+                # Regular instruction - increment address
+                address += 1
             
-            if line.startswith('.DATA'):
-                # Data directive - skip for now
-                continue
+            elif kind == 'label':
+                self.labels[payload] = address
             
-            # Check for labels
-            if line.endswith(':'):
-                label = line[:-1].strip()
-                self.labels[label] = address
-                continue
+            elif kind == 'org':
+                # Set origin address
+                address = self.parse_immediate(payload)
+                self.current_address = address
             
-            # Regular instruction - increment address
-            address += 1
+            # Data directive - skip for now
     
-    def second_pass(self, lines: List[str]):
+    def second_pass(self, parsed: List[Tuple[str, str, int]]):
         """Second pass: assemble instructions."""
         address = 0
         
-        for line_num, line in enumerate(lines, 1):
-            # Remove comments
-            line = line.split(';')[0].strip()
-            
-            if not line:
-                continue
-            
-            # Handle directives
-            if line.startswith('.ORG'):
-                parts = line.split()
-                address = self.parse_immediate(parts[1])
+        for kind, line, line_num in parsed:
+            if kind == 'org':
+                address = self.parse_immediate(line)
                 continue
             
-            if line.startswith('.DATA'):
-                # TODO: Handle data section
-                continue
-            
-            # Skip labels
-            if line.endswith(':'):
+            # TODO: Handle data section; labels were resolved in first_pass
+            if kind != 'instr':
                 continue
             
             # Assemble instruction
             try:
                 result = self.assemble_line(line, address)
                 if result:
-                    self.instructions.append(result)
+                    self._emit(*result)
                     address += 1
             except Exception as e:
                 print(f"Error on line {line_num}: {line}", file=sys.stderr)
                 print(f"  {e}", file=sys.stderr)
                 raise
     
+    def _emit(self, address: int, instruction: int):
+        """Store an instruction in output, zero-filling any gap before it."""
+        output = self.output
+        if address >= len(output):
+            output.extend([0] * (address + 1 - len(output)))
+        output[address] = instruction
+    
     def assemble(self, source_code: str) -> List[int]:
         """
         Assemble complete program.
         
         Returns: List of 16-bit machine code instructions
         """
-        lines = source_code.split('\n')
-        
-        # Two-pass assembly
-        self.first_pass(lines)
-        self.second_pass(lines)
+        self._parsed = self.parse_lines(source_code.split('\n'))
         
-        # Create output array
-        if not self.instructions:
-            return []
+        # Two-pass assembly over the same tokenized lines
+        self.first_pass(self._parsed)
+        self.second_pass(self._parsed)
         
-        max_addr = max(addr for addr, _ in self.instructions)
-        output = [0] * (max_addr + 1)
-        
-        for addr, instruction in self.instructions:
-            output[addr] = instruction
-        
-        return output
+        return self.output.tolist()
     
     def assemble_file(self, input_file: str, output_file: str = None):
         """Assemble from file and optionally write to output file."""
@@ -261,41 +311,28 @@ class Assembler:
         machine_code = self.assemble(source_code)
         
         if output_file:
+            # Write as 16-bit little-endian, in one write
+            words = self.output
+            if sys.byteorder == 'big':
+                words = array('H', words)
+                words.byteswap()
             with open(output_file, 'wb') as f:
-                for instruction in machine_code:
-                    # Write as 16-bit little-endian
-                    f.write(instruction.to_bytes(2, byteorder='little'))
+                f.write(words.tobytes())
         
         return machine_code
     
     def disassemble(self, machine_code: List[int]) -> str:
         """Disassemble machine code back to assembly (for debugging)."""
-        lines = []
-        
-        opcode_names = {v: k for k, v in OPCODES.items()}
-        
-        for addr, instruction in enumerate(machine_code):
-            if instruction == 0:
-                continue
-            
-            opcode = (instruction >> 12) & 0xF
-            rd = (instruction >> 8) & 0xF
-            rs1 = (instruction >> 4) & 0xF
-            rs2 = instruction & 0xF
-            imm = instruction & 0xFF
-            
-            op_name = opcode_names.get(opcode, f"UNKNOWN({opcode})")
-            
-            if opcode in [0x1, 0x2, 0x3, 0xC, 0xD, 0xE]:
-                lines.append(f"{addr:3d}: {op_name} R{rd}, {imm}")
-            elif opcode == 0xF:
-                lines.append(f"{addr:3d}: {op_name} R{rd}")
-            elif opcode in [0x6, 0x7]:
-                lines.append(f"{addr:3d}: {op_name} R{rd}")
-            elif opcode == 0xB:
-                lines.append(f"{addr:3d}: {op_name} R{rd}, R{rs1}")
-            else:
-                lines.append(f"{addr:3d}: {op_name} R{rd}, R{rs1}, R{rs2}")
+        machine_code = list(machine_code)  # read twice below; accept any iterable
+        lines = [
+            f"{addr:3d}: " + DISASM_FORMATS[(instruction >> 12) & 0xF].format(
+                rd=(instruction >> 8) & 0xF,
+                rs1=(instruction >> 4) & 0xF,
+                rs2=instruction & 0xF,
+                imm=instruction & 0xFF)
+            # compress() drops the zero (empty) words in C
+            for addr, instruction in compress(enumerate(machine_code), machine_code)
+        ]
         
         return '\n'.join(lines)
 
@@ -5,19 +5,14 @@ NAND Compute Demo
 Demonstrates the complete computer built from NAND gates.
 """
 
-import sys
 import os
 
-# Add paths
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'logic'))
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'arithmetic'))
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'assembly'))
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'vm'))
-
+# The script's directory is already on sys.path, so each layer imports
+# as a package (assembly/ and vm/ as namespace packages)
 from logic import NAND, AND, OR, NOT
 from arithmetic import ALU
-from assembler import Assembler
-from emulator import VM
+from assembly.assembler import Assembler
+from vm.emulator import VM
 
 
 def demo_banner(title):
@@ -63,32 +58,29 @@ def demo_alu():
     
     print("The ALU performs arithmetic and logical operations.\n")
     
-    def int_to_bits(val, n=8):
-        return [bool((val >> i) & 1) for i in range(n)]
-    
-    def bits_to_int(bits):
-        return sum(b << i for i, b in enumerate(bits))
-    
     alu = ALU(n_bits=8)
     
+    # compute_int takes and returns the 8-bit values directly, so no
+    # bit-list conversion is needed around each operation
+    
     # Addition
     a, b = 42, 18
-    result = alu.compute(int_to_bits(a), int_to_bits(b), 0)
-    print(f"Addition:   {a} + {b} = {bits_to_int(result)}")
+    result = alu.compute_int(a, b, 0)
+    print(f"Addition:   {a} + {b} = {result}")
     
     # Subtraction
     a, b = 100, 25
-    result = alu.compute(int_to_bits(a), int_to_bits(b), 1)
-    print(f"Subtraction: {a} - {b} = {bits_to_int(result)}")
+    result = alu.compute_int(a, b, 1)
+    print(f"Subtraction: {a} - {b} = {result}")
     
     # Bitwise AND
     a, b = 0b11110000, 0b10101010
-    result = alu.compute(int_to_bits(a), int_to_bits(b), 2)
-    print(f"Bitwise AND: 0b{a:08b} & 0b{b:08b} = 0b{bits_to_int(result):08b}")
+    result = alu.compute_int(a, b, 2)
+    print(f"Bitwise AND: 0b{a:08b} & 0b{b:08b} = 0b{result:08b}")
     
     # Bitwise OR
-    result = alu.compute(int_to_bits(a), int_to_bits(b), 3)
-    print(f"Bitwise OR:  0b{a:08b} | 0b{b:08b} = 0b{bits_to_int(result):08b}")
+    result = alu.compute_int(a, b, 3)
+    print(f"Bitwise OR:  0b{a:08b} | 0b{b:08b} = 0b{result:08b}")
     
     print("\nThe ALU is the computational heart of the CPU!")
     
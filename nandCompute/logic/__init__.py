@@ -3,17 +3,25 @@
 from .nand import NAND, NAND_multi, NANDGate
 from .basic_gates import (
     NOT, AND, OR, XOR, NOR, XNOR,
-    NOT_n, AND_n, OR_n, XOR_n
+    NOT_n, AND_n, OR_n, XOR_n,
+    NOT_nb, AND_nb, OR_nb, XOR_nb,
+    bits_to_int, int_to_bits
 )
 from .composite_gates import (
     MUX, DMUX, MUX4WAY, MUX8WAY, DMUX4WAY, DMUX8WAY,
-    MUX_n, MUX4WAY_n, MUX8WAY_n
+    DMUX_gates, MUX4WAY_gates, MUX8WAY_gates, DMUX4WAY_gates, DMUX8WAY_gates,
+    MUX_n, MUX4WAY_n, MUX8WAY_n,
+    MUX_nb, MUX4WAY_nb, MUX8WAY_nb
 )
 
 __all__ = [
     'NAND', 'NAND_multi', 'NANDGate',
     'NOT', 'AND', 'OR', 'XOR', 'NOR', 'XNOR',
     'NOT_n', 'AND_n', 'OR_n', 'XOR_n',
+    'NOT_nb', 'AND_nb', 'OR_nb', 'XOR_nb',
+    'bits_to_int', 'int_to_bits',
     'MUX', 'DMUX', 'MUX4WAY', 'MUX8WAY', 'DMUX4WAY', 'DMUX8WAY',
-    'MUX_n', 'MUX4WAY_n', 'MUX8WAY_n'
+    'DMUX_gates', 'MUX4WAY_gates', 'MUX8WAY_gates', 'DMUX4WAY_gates', 'DMUX8WAY_gates',
+    'MUX_n', 'MUX4WAY_n', 'MUX8WAY_n',
+    'MUX_nb', 'MUX4WAY_nb', 'MUX8WAY_nb'
 ]
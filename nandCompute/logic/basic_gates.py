@@ -5,6 +5,8 @@ This module implements fundamental logic gates using only NAND gates.
 This demonstrates how NAND is functionally complete.
 """
 
+from collections.abc import Sequence
+
 from .nand import NAND
 
 
@@ -23,6 +25,51 @@ def NOT(a: bool) -> bool:
     return NAND(a, a)
 
 
+# NAND circuits for the two-input gates. The public gates below look up
+# truth tables computed from these once, when the module is loaded.
+def _AND_nand(a: bool, b: bool) -> bool:
+    """AND(a, b) = NAND(NAND(a, b), NAND(a, b))"""
+    nand_out = NAND(a, b)
+    return NAND(nand_out, nand_out)
+
+
+def _OR_nand(a: bool, b: bool) -> bool:
+    """OR(a, b) = NAND(NAND(a, a), NAND(b, b))"""
+    not_a = NAND(a, a)
+    not_b = NAND(b, b)
+    return NAND(not_a, not_b)
+
+
+def _XOR_nand(a: bool, b: bool) -> bool:
+    """XOR(a, b) from four NANDs."""
+    nand_ab = NAND(a, b)
+    nand_a_nand = NAND(a, nand_ab)
+    nand_b_nand = NAND(b, nand_ab)
+    return NAND(nand_a_nand, nand_b_nand)
+
+
+def _NOR_nand(a: bool, b: bool) -> bool:
+    """NOR(a, b) = NOT(OR(a, b))"""
+    return NOT(_OR_nand(a, b))
+
+
+def _XNOR_nand(a: bool, b: bool) -> bool:
+    """XNOR(a, b) = NOT(XOR(a, b))"""
+    return NOT(_XOR_nand(a, b))
+
+
+def _truth_table(gate) -> tuple[bool, ...]:
+    """Outputs of a two-input gate, indexed by (a << 1) | b."""
+    return tuple(gate(a, b) for a in (False, True) for b in (False, True))
+
+
+_AND_T = _truth_table(_AND_nand)
+_OR_T = _truth_table(_OR_nand)
+_XOR_T = _truth_table(_XOR_nand)
+_NOR_T = _truth_table(_NOR_nand)
+_XNOR_T = _truth_table(_XNOR_nand)
+
+
 def AND(a: bool, b: bool) -> bool:
     """
     AND gate built from NAND.
@@ -38,8 +85,7 @@ def AND(a: bool, b: bool) -> bool:
     1 | 0 | 0
     1 | 1 | 1
     """
-    nand_out = NAND(a, b)
-    return NAND(nand_out, nand_out)
+    return _AND_T[(bool(a) << 1) | bool(b)]
 
 
 def OR(a: bool, b: bool) -> bool:
@@ -57,9 +103,7 @@ def OR(a: bool, b: bool) -> bool:
     1 | 0 | 1
     1 | 1 | 1
     """
-    not_a = NAND(a, a)
-    not_b = NAND(b, b)
-    return NAND(not_a, not_b)
+    return _OR_T[(bool(a) << 1) | bool(b)]
 
 
 def XOR(a: bool, b: bool) -> bool:
@@ -76,10 +120,7 @@ def XOR(a: bool, b: bool) -> bool:
     1 | 0 | 1
     1 | 1 | 0
     """
-    nand_ab = NAND(a, b)
-    nand_a_nand = NAND(a, nand_ab)
-    nand_b_nand = NAND(b, nand_ab)
-    return NAND(nand_a_nand, nand_b_nand)
+    return _XOR_T[(bool(a) << 1) | bool(b)]
 
 
 def NOR(a: bool, b: bool) -> bool:
@@ -88,8 +129,7 @@ def NOR(a: bool, b: bool) -> bool:
     
     NOR(a, b) = NOT(OR(a, b))
     """
-    or_out = OR(a, b)
-    return NOT(or_out)
+    return _NOR_T[(bool(a) << 1) | bool(b)]
 
 
 def XNOR(a: bool, b: bool) -> bool:
@@ -106,32 +146,82 @@ def XNOR(a: bool, b: bool) -> bool:
     1 | 0 | 0
     1 | 1 | 1
     """
-    xor_out = XOR(a, b)
-    return NOT(xor_out)
+    return _XNOR_T[(bool(a) << 1) | bool(b)]
+
+
+# Bit-list <-> integer conversion (bit lists are LSB first). From
+# _WIDE_BITS bits up, words convert through a '0'/'1' byte string so the
+# per-bit work runs in C (bytes, translate, int/format) rather than in a
+# Python loop; below that the loop is cheaper.
+_WIDE_BITS = 16
+_BITS_TO_DIGITS = bytes.maketrans(b'\x00\x01', b'01')
+_DIGITS_TO_BITS = bytes.maketrans(b'01', b'\x00\x01')
+
+
+def bits_to_int(bits: Sequence[bool]) -> int:
+    """Pack a bit list (LSB at index 0) into an unsigned integer."""
+    if len(bits) >= _WIDE_BITS:
+        return int(bytes(map(bool, bits))[::-1].translate(_BITS_TO_DIGITS), 2)
+    value = 0
+    for bit in reversed(bits):
+        value = (value << 1) | bool(bit)
+    return value
+
+
+def int_to_bits(value: int, n: int) -> list[bool]:
+    """Unpack the low n bits of an integer into a bit list (LSB first)."""
+    if n >= _WIDE_BITS:
+        digits = format(value & ((1 << n) - 1), f'0{n}b').encode()
+        return list(map(bool, digits[::-1].translate(_DIGITS_TO_BITS)))
+    return [bool((value >> i) & 1) for i in range(n)]
+
+
+# Multi-bit versions on packed integers: bit i of the int is bit i of the
+# word, so each n-bit operation is a single integer operation.
+def NOT_nb(x: int, width: int) -> int:
+    """Bitwise NOT of a width-bit integer."""
+    return ~x & ((1 << width) - 1)
+
+
+def AND_nb(x: int, y: int) -> int:
+    """Bitwise AND of two packed integers."""
+    return x & y
+
+
+def OR_nb(x: int, y: int) -> int:
+    """Bitwise OR of two packed integers."""
+    return x | y
+
+
+def XOR_nb(x: int, y: int) -> int:
+    """Bitwise XOR of two packed integers."""
+    return x ^ y
 
 
-# Multi-bit versions
-def NOT_n(bits: list[bool]) -> list[bool]:
+# Multi-bit versions on bit lists. Bit for bit these equal applying the
+# gate to each position; they pack to an int, do one operation, and unpack.
+# Results are tuples, as nothing modifies a gate's output in place.
+def NOT_n(bits: Sequence[bool]) -> tuple[bool, ...]:
     """Apply NOT to each bit in a list."""
-    return [NOT(bit) for bit in bits]
+    return tuple(int_to_bits(NOT_nb(bits_to_int(bits), len(bits)), len(bits)))
 
 
-def AND_n(a: list[bool], b: list[bool]) -> list[bool]:
+def AND_n(a: Sequence[bool], b: Sequence[bool]) -> tuple[bool, ...]:
     """Bitwise AND of two bit arrays."""
     assert len(a) == len(b), "Bit arrays must be same length"
-    return [AND(a[i], b[i]) for i in range(len(a))]
+    return tuple(int_to_bits(AND_nb(bits_to_int(a), bits_to_int(b)), len(a)))
 
 
-def OR_n(a: list[bool], b: list[bool]) -> list[bool]:
+def OR_n(a: Sequence[bool], b: Sequence[bool]) -> tuple[bool, ...]:
     """Bitwise OR of two bit arrays."""
     assert len(a) == len(b), "Bit arrays must be same length"
-    return [OR(a[i], b[i]) for i in range(len(a))]
+    return tuple(int_to_bits(OR_nb(bits_to_int(a), bits_to_int(b)), len(a)))
 
 
-def XOR_n(a: list[bool], b: list[bool]) -> list[bool]:
+def XOR_n(a: Sequence[bool], b: Sequence[bool]) -> tuple[bool, ...]:
     """Bitwise XOR of two bit arrays."""
     assert len(a) == len(b), "Bit arrays must be same length"
-    return [XOR(a[i], b[i]) for i in range(len(a))]
+    return tuple(int_to_bits(XOR_nb(bits_to_int(a), bits_to_int(b)), len(a)))
 
 
 if __name__ == "__main__":
@@ -2,9 +2,14 @@
 Composite Logic Gates - MUX, DMUX, and Multi-bit Operations
 
 These gates are essential for building the CPU and memory systems.
+
+Input shapes are checked with plain asserts, without generator
+expressions, so the checks stay cheap and `python -O` removes them.
 """
 
-from .basic_gates import AND, OR, NOT
+from collections.abc import Sequence
+
+from .basic_gates import AND, OR, NOT, bits_to_int
 
 
 def MUX(a: bool, b: bool, sel: bool) -> bool:
@@ -27,13 +32,25 @@ def DMUX(input_bit: bool, sel: bool) -> tuple[bool, bool]:
     If sel == 1: a = 0, b = input
     
     Returns: (a, b)
+    
+    Same result as the gate version, DMUX_gates.
+    """
+    input_bit = bool(input_bit)
+    return (False, input_bit) if sel else (input_bit, False)
+
+
+def DMUX_gates(input_bit: bool, sel: bool) -> tuple[bool, bool]:
+    """
+    Demultiplexer built from gates.
+    
+    a = AND(input, NOT(sel)), b = AND(input, sel)
     """
     a = AND(input_bit, NOT(sel))
     b = AND(input_bit, sel)
     return (a, b)
 
 
-def MUX4WAY(a: bool, b: bool, c: bool, d: bool, sel: list[bool]) -> bool:
+def MUX4WAY(a: bool, b: bool, c: bool, d: bool, sel: Sequence[bool]) -> bool:
     """
     4-way multiplexer.
     
@@ -43,6 +60,18 @@ def MUX4WAY(a: bool, b: bool, c: bool, d: bool, sel: list[bool]) -> bool:
        0     1    |   b
        1     0    |   c
        1     1    |   d
+    
+    Same result as the MUX tree in MUX4WAY_gates; the select bits are
+    read as an index instead.
+    """
+    assert len(sel) == 2, "Need 2 select bits for 4-way MUX"
+    
+    return bool((a, b, c, d)[(bool(sel[1]) << 1) | bool(sel[0])])
+
+
+def MUX4WAY_gates(a: bool, b: bool, c: bool, d: bool, sel: Sequence[bool]) -> bool:
+    """
+    4-way multiplexer built from a tree of three 2-way MUXes.
     """
     assert len(sel) == 2, "Need 2 select bits for 4-way MUX"
     
@@ -51,13 +80,26 @@ def MUX4WAY(a: bool, b: bool, c: bool, d: bool, sel: list[bool]) -> bool:
     return MUX(mux_ab, mux_cd, sel[1])
 
 
-def MUX8WAY(inputs: list[bool], sel: list[bool]) -> bool:
+def MUX8WAY(inputs: Sequence[bool], sel: Sequence[bool]) -> bool:
     """
     8-way multiplexer.
     
     Args:
         inputs: 8 input bits [a, b, c, d, e, f, g, h]
-        sel: 3 select bits [sel2, sel1, sel0]
+        sel: 3 select bits [sel0, sel1, sel2] (LSB first)
+    
+    Same result as the MUX tree in MUX8WAY_gates; the select bits are
+    read as an index instead.
+    """
+    assert len(inputs) == 8, "Need 8 inputs"
+    assert len(sel) == 3, "Need 3 select bits for 8-way MUX"
+    
+    return bool(inputs[(bool(sel[2]) << 2) | (bool(sel[1]) << 1) | bool(sel[0])])
+
+
+def MUX8WAY_gates(inputs: Sequence[bool], sel: Sequence[bool]) -> bool:
+    """
+    8-way multiplexer built from a tree of seven 2-way MUXes.
     """
     assert len(inputs) == 8, "Need 8 inputs"
     assert len(sel) == 3, "Need 3 select bits for 8-way MUX"
@@ -76,63 +118,110 @@ def MUX8WAY(inputs: list[bool], sel: list[bool]) -> bool:
     return MUX(m4, m5, sel[2])
 
 
-def DMUX4WAY(input_bit: bool, sel: list[bool]) -> tuple[bool, bool, bool, bool]:
+def DMUX4WAY(input_bit: bool, sel: Sequence[bool]) -> tuple[bool, bool, bool, bool]:
     """
     4-way demultiplexer.
     
     Routes input to one of 4 outputs based on 2 select bits.
+    Same result as the DMUX tree in DMUX4WAY_gates: a one-hot tuple with
+    input_bit at the selected index.
+    """
+    assert len(sel) == 2, "Need 2 select bits for 4-way DMUX"
+    
+    outputs = [False] * 4
+    outputs[(bool(sel[1]) << 1) | bool(sel[0])] = bool(input_bit)
+    return tuple(outputs)
+
+
+def DMUX4WAY_gates(input_bit: bool, sel: Sequence[bool]) -> tuple[bool, bool, bool, bool]:
+    """
+    4-way demultiplexer built from a DMUX feeding two DMUXes.
     """
     assert len(sel) == 2, "Need 2 select bits for 4-way DMUX"
     
     # First level
-    ab, cd = DMUX(input_bit, sel[1])
+    ab, cd = DMUX_gates(input_bit, sel[1])
     
     # Second level
-    a, b = DMUX(ab, sel[0])
-    c, d = DMUX(cd, sel[0])
+    a, b = DMUX_gates(ab, sel[0])
+    c, d = DMUX_gates(cd, sel[0])
     
     return (a, b, c, d)
 
 
-def DMUX8WAY(input_bit: bool, sel: list[bool]) -> list[bool]:
+def DMUX8WAY(input_bit: bool, sel: Sequence[bool]) -> tuple[bool, ...]:
     """
     8-way demultiplexer.
     
     Routes input to one of 8 outputs based on 3 select bits.
+    Same result as the DMUX tree in DMUX8WAY_gates: a one-hot tuple with
+    input_bit at the selected index.
+    """
+    assert len(sel) == 3, "Need 3 select bits for 8-way DMUX"
+    
+    outputs = [False] * 8
+    outputs[(bool(sel[2]) << 2) | (bool(sel[1]) << 1) | bool(sel[0])] = bool(input_bit)
+    return tuple(outputs)
+
+
+def DMUX8WAY_gates(input_bit: bool, sel: Sequence[bool]) -> tuple[bool, ...]:
+    """
+    8-way demultiplexer built from a DMUX feeding two DMUX4WAYs.
     """
     assert len(sel) == 3, "Need 3 select bits for 8-way DMUX"
     
     # First level
-    lower, upper = DMUX(input_bit, sel[2])
+    lower, upper = DMUX_gates(input_bit, sel[2])
     
     # Second level
-    a, b, c, d = DMUX4WAY(lower, sel[:2])
-    e, f, g, h = DMUX4WAY(upper, sel[:2])
+    a, b, c, d = DMUX4WAY_gates(lower, sel[:2])
+    e, f, g, h = DMUX4WAY_gates(upper, sel[:2])
     
-    return [a, b, c, d, e, f, g, h]
+    return (a, b, c, d, e, f, g, h)
+
+
+# Multi-bit multiplexers on packed integers (see basic_gates.AND_nb):
+# selecting a whole word is a single choice, whatever the width.
+def MUX_nb(x: int, y: int, sel: bool) -> int:
+    """Select x (sel == 0) or y (sel == 1)."""
+    return y if sel else x
+
+
+def MUX4WAY_nb(a: int, b: int, c: int, d: int, sel: int) -> int:
+    """Select one of 4 packed words by a 2-bit select value."""
+    return (a, b, c, d)[sel]
+
+
+def MUX8WAY_nb(inputs: Sequence[int], sel: int) -> int:
+    """Select one of 8 packed words by a 3-bit select value."""
+    return inputs[sel]
 
 
 # Multi-bit operations
-def MUX_n(a: list[bool], b: list[bool], sel: bool) -> list[bool]:
+def MUX_n(a: Sequence[bool], b: Sequence[bool], sel: bool) -> tuple[bool, ...]:
     """
     N-bit multiplexer.
     Apply MUX to each bit position.
+    
+    Every bit shares the same select, so this copies the selected word
+    as bools.
     """
     assert len(a) == len(b), "Input arrays must be same length"
-    return [MUX(a[i], b[i], sel) for i in range(len(a))]
+    return tuple(map(bool, b if sel else a))
 
 
-def MUX4WAY_n(a: list[bool], b: list[bool], c: list[bool], d: list[bool], 
-              sel: list[bool]) -> list[bool]:
+def MUX4WAY_n(a: Sequence[bool], b: Sequence[bool], c: Sequence[bool], d: Sequence[bool], 
+              sel: Sequence[bool]) -> tuple[bool, ...]:
     """
     N-bit 4-way multiplexer.
     """
     n = len(a)
-    assert all(len(x) == n for x in [b, c, d]), "All inputs must be same length"
-    return [MUX4WAY(a[i], b[i], c[i], d[i], sel) for i in range(n)]
+    assert len(b) == len(c) == len(d) == n, "All inputs must be same length"
+    assert len(sel) == 2, "Need 2 select bits for 4-way MUX"
+    return tuple(map(bool, (a, b, c, d)[bits_to_int(sel)]))
 
 
-def MUX8WAY_n(inputs: list[list[bool]], sel: list[bool]) -> list[bool]:
+def MUX8WAY_n(inputs: Sequence[Sequence[bool]], sel: Sequence[bool]) -> tuple[bool, ...]:
     """
     N-bit 8-way multiplexer.
     
@@ -142,9 +231,10 @@ def MUX8WAY_n(inputs: list[list[bool]], sel: list[bool]) -> list[bool]:
     """
     assert len(inputs) == 8, "Need 8 input arrays"
     n = len(inputs[0])
-    assert all(len(x) == n for x in inputs), "All inputs must be same length"
+    assert set(map(len, inputs)) == {n}, "All inputs must be same length"
+    assert len(sel) == 3, "Need 3 select bits for 8-way MUX"
     
-    return [MUX8WAY([inputs[j][i] for j in range(8)], sel) for i in range(n)]
+    return tuple(map(bool, inputs[bits_to_int(sel)]))
 
 
 if __name__ == "__main__":
@@ -0,0 +1,84 @@
+"""
+Numba-compiled Logic Gates
+
+The same NAND-built gate stack as nand/basic_gates/composite_gates,
+compiled with Numba. Each gate is inlined into its caller, so a jitted
+circuit such as XOR or MUX collapses into a single tree of NANDs.
+
+Calling these one at a time from Python is no faster than the plain
+gates (every call crosses the Python/native boundary); they pay off
+when called from inside another @njit function, e.g. a jitted ALU
+loop. Requires numba, so it is not imported by the logic package:
+use `from logic import jit`.
+"""
+
+from numba import njit, bool_, types
+
+
+_gate2 = bool_(bool_, bool_)
+
+
+@njit(_gate2, cache=True, inline='always')
+def NAND(a, b):
+    """NOT (a AND b) - the only primitive."""
+    return not (a and b)
+
+
+@njit(bool_(bool_), cache=True, inline='always')
+def NOT(a):
+    """NOT(a) = NAND(a, a)"""
+    return NAND(a, a)
+
+
+@njit(_gate2, cache=True, inline='always')
+def AND(a, b):
+    """AND(a, b) = NOT(NAND(a, b))"""
+    nand_out = NAND(a, b)
+    return NAND(nand_out, nand_out)
+
+
+@njit(_gate2, cache=True, inline='always')
+def OR(a, b):
+    """OR(a, b) = NAND(NOT(a), NOT(b))"""
+    return NAND(NAND(a, a), NAND(b, b))
+
+
+@njit(_gate2, cache=True, inline='always')
+def XOR(a, b):
+    """XOR from four NANDs."""
+    nand_ab = NAND(a, b)
+    return NAND(NAND(a, nand_ab), NAND(b, nand_ab))
+
+
+@njit(_gate2, cache=True, inline='always')
+def NOR(a, b):
+    """NOR(a, b) = NOT(OR(a, b))"""
+    return NOT(OR(a, b))
+
+
+@njit(_gate2, cache=True, inline='always')
+def XNOR(a, b):
+    """XNOR(a, b) = NOT(XOR(a, b))"""
+    return NOT(XOR(a, b))
+
+
+@njit(bool_(bool_, bool_, bool_), cache=True, inline='always')
+def MUX(a, b, sel):
+    """MUX(a, b, sel) = (NOT(sel) AND a) OR (sel AND b)"""
+    return OR(AND(NOT(sel), a), AND(sel, b))
+
+
+@njit(types.UniTuple(bool_, 2)(bool_, bool_), cache=True, inline='always')
+def DMUX(input_bit, sel):
+    """Route input_bit to a (sel == 0) or b (sel == 1). Returns (a, b)."""
+    return (AND(input_bit, NOT(sel)), AND(input_bit, sel))
+
+
+if __name__ == "__main__":
+    print("Numba-compiled Gates\n")
+    print("A | B | NAND | AND | OR | XOR | MUX(sel=1)")
+    print("--|---|------|-----|----|-----|-----------")
+    for a in [False, True]:
+        for b in [False, True]:
+            print(f"{int(a)} | {int(b)} |  {int(NAND(a, b))}   |  {int(AND(a, b))}  |"
+                  f"  {int(OR(a, b))} |  {int(XOR(a, b))}  |     {int(MUX(a, b, True))}")
@@ -42,15 +42,15 @@ def NAND_multi(inputs: list[bool]) -> bool:
     
     Returns:
         NOT (AND of all inputs)
+    
+    all() evaluates the AND in C and stops at the first 0 input. This is
+    deliberately not memoized: building and hashing a tuple key costs
+    more than the scan itself.
     """
     if not inputs:
         return True
     
-    result = inputs[0]
-    for bit in inputs[1:]:
-        result = result and bit
-    
-    return not result
+    return not all(inputs)
 
 
 class NANDGate:
@@ -59,6 +59,8 @@ class NANDGate:
     Useful for building more complex circuits.
     """
     
+    __slots__ = ('input_a', 'input_b', '_output')
+    
     def __init__(self):
         self.input_a = False
         self.input_b = False
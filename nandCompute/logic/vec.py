@@ -0,0 +1,66 @@
+"""
+Vectorized Multi-bit Gates - NumPy Packed Bit Arrays
+
+Bitwise gates over bit vectors packed eight bits per byte in NumPy uint8
+arrays, so a whole vector is processed in one C loop. Useful for wide
+words; the *_n gates in basic_gates remain the dependency-free version.
+
+Requires numpy, so it is not imported by the logic package: use
+`from logic import vec`. Bit lists are LSB first, as everywhere else.
+"""
+
+import numpy as np
+
+
+def bits_to_packed(bits: list[bool]) -> np.ndarray:
+    """Pack a bit list (LSB at index 0) into a uint8 array."""
+    return np.packbits(np.asarray(bits, dtype=np.uint8), bitorder='little')
+
+
+def packed_to_bits(packed: np.ndarray, n: int) -> list[bool]:
+    """Unpack the first n bits of a packed array into a bit list."""
+    return np.unpackbits(packed, count=n, bitorder='little').astype(bool).tolist()
+
+
+def and_bits(a: np.ndarray, b: np.ndarray) -> np.ndarray:
+    """Bitwise AND of two packed bit arrays."""
+    return np.bitwise_and(a, b)
+
+
+def or_bits(a: np.ndarray, b: np.ndarray) -> np.ndarray:
+    """Bitwise OR of two packed bit arrays."""
+    return np.bitwise_or(a, b)
+
+
+def xor_bits(a: np.ndarray, b: np.ndarray) -> np.ndarray:
+    """Bitwise XOR of two packed bit arrays."""
+    return np.bitwise_xor(a, b)
+
+
+def not_bits(a: np.ndarray) -> np.ndarray:
+    """
+    Bitwise NOT of a packed bit array.
+
+    Padding bits in the last byte are inverted too; packed_to_bits with
+    the original length drops them.
+    """
+    return np.invert(a)
+
+
+if __name__ == "__main__":
+    print("Vectorized Gates (NumPy)\n")
+
+    a = [True] * 8 + [False] * 8   # 0x00FF
+    b = [True, False] * 8          # 0x5555
+    pa, pb = bits_to_packed(a), bits_to_packed(b)
+
+    def bits_to_hex(bits):
+        val = sum(bit << i for i, bit in enumerate(bits))
+        return f"0x{val:04X}"
+
+    print(f"a       = {bits_to_hex(a)}")
+    print(f"b       = {bits_to_hex(b)}")
+    print(f"a AND b = {bits_to_hex(packed_to_bits(and_bits(pa, pb), 16))}")
+    print(f"a OR b  = {bits_to_hex(packed_to_bits(or_bits(pa, pb), 16))}")
+    print(f"a XOR b = {bits_to_hex(packed_to_bits(xor_bits(pa, pb), 16))}")
+    print(f"NOT a   = {bits_to_hex(packed_to_bits(not_bits(pa), 16))}")
@@ -4,48 +4,135 @@ Test Suite for NAND Compute
 Tests logic gates, arithmetic, and the complete system.
 """
 
+import functools
+import io
 import sys
 import os
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+import traceback
+import unittest
+from array import array
 
-from logic import NAND, AND, OR, XOR, NOT, MUX, DMUX
-from arithmetic import half_adder, full_adder, add_n, ALU
+_HERE = os.path.dirname(__file__)
+sys.path.insert(0, os.path.join(_HERE, '..'))
+
+from logic import NAND, AND, OR, XOR, NOT, MUX, DMUX, NOT_n, AND_n, XOR_n, NOT_nb
+from logic import bits_to_int, int_to_bits
+from logic import MUX4WAY, MUX8WAY, DMUX4WAY, DMUX8WAY, MUX_n, MUX4WAY_n, MUX8WAY_n
+from logic import DMUX_gates, MUX4WAY_gates, MUX8WAY_gates, DMUX4WAY_gates, DMUX8WAY_gates
+from arithmetic import half_adder, full_adder, add_n, add_n_gates, sub_n, increment_n, ALU
+from assembly.assembler import Assembler
+from vm.emulator import VM
+
+
+# Two-input truth tables packed into a nibble: bit (a << 1) | b holds
+# gate(a, b). The inputs themselves pack to A = 0b1100 and B = 0b1010, so
+# the expected table for a gate is the same bitwise op on A and B.
+A, B = 0b1100, 0b1010
+NAND_TT = ~(A & B) & 0xF    # 0b0111
+
+
+# Bit vectors (LSB first) for every 4- and 8-bit value, built once. The
+# 8-bit operands are compact array('B') buffers of 0/1, which the ALU and
+# adders accept like bit lists.
+BITS4 = tuple(int_to_bits(v, 4) for v in range(16))
+BITS8 = tuple(array('B', int_to_bits(v, 8)) for v in range(256))
+
+
+# Gate-level reference per ALU opcode on 8-bit bit vectors, built from the
+# NAND gates and the full-adder chain rather than integer arithmetic. SUB
+# adds the two's complement of b, NOT(b) + 1, also formed with the adder.
+_ONE8 = int_to_bits(1, 8)
+NEG8 = tuple(add_n_gates([NOT(x) for x in bits], _ONE8)[:-1] for bits in BITS8)
+ALU_GATES = (
+    lambda a, b: add_n_gates(a, b)[:-1],                      # ADD
+    lambda a, b: add_n_gates(a, NEG8[bits_to_int(b)])[:-1],   # SUB
+    lambda a, b: [AND(p, q) for p, q in zip(a, b)],           # AND
+    lambda a, b: [OR(p, q) for p, q in zip(a, b)],            # OR
+    lambda a, b: [XOR(p, q) for p, q in zip(a, b)],           # XOR
+    lambda a, b: [NOT(p) for p in a],                         # NOT
+    lambda a, b: list(a),                                     # PASS_A
+    lambda a, b: list(b),                                     # PASS_B
+    lambda a, b: [False] * 8,                                 # ZERO
+)
+
+
+# Example programs run by the VM tests
+_EXAMPLES = os.path.join(_HERE, '..', 'assembly', 'examples')
+_HELLO = os.path.join(_EXAMPLES, 'hello_world.asm')
+_COUNTER = os.path.join(_EXAMPLES, 'counter.asm')
+
+# Instruction budget per program; both examples halt well within it
+_MAX_INSTRUCTIONS = 1000
+
+
+# Pass messages, written out in one go by the script runner
+_log = io.StringIO()
+
+
+# Shared instances; VM tests reset the VM before loading a program
+_ALU8 = ALU(n_bits=8)
+_VM = VM()
+
+
+def truth_table(gate) -> int:
+    """Pack a two-input gate's outputs into a nibble."""
+    table = 0
+    for i in range(4):
+        table |= gate(bool(i >> 1), bool(i & 1)) << i
+    return table
+
+
+def _require(path: str):
+    """Skip the calling test if an example program is missing."""
+    if not os.path.isfile(path):
+        raise unittest.SkipTest(f"{os.path.basename(path)} not found")
+
+
+@functools.lru_cache(maxsize=32)
+def _assemble(path: str, mtime: float) -> tuple[int, ...]:
+    """Assemble a program once per (path, modification time)."""
+    return tuple(Assembler().assemble_file(path))
 
 
 def test_nand():
     """Test NAND gate (the primitive)."""
-    assert NAND(False, False) == True
-    assert NAND(False, True) == True
-    assert NAND(True, False) == True
-    assert NAND(True, True) == False
-    print("✓ NAND gate tests passed")
+    assert truth_table(NAND) == NAND_TT
+    _log.write("✓ NAND gate tests passed\n")
 
 
 def test_basic_gates():
     """Test basic logic gates."""
-    # NOT
-    assert NOT(False) == True
-    assert NOT(True) == False
+    assert truth_table(lambda a, b: NOT(a)) == ~A & 0xF
+    assert truth_table(AND) == A & B    # 0b1000
+    assert truth_table(OR) == A | B     # 0b1110
+    assert truth_table(XOR) == A ^ B    # 0b0110
+    
+    # Multi-bit (LSB first)
+    a = [True, True, False, False]
+    b = [True, False, True, False]
+    assert NOT_n(a) == (False, False, True, True)
+    assert AND_n(a, b) == (True, False, False, False)
+    assert XOR_n(a, b) == (False, True, True, False)
+    assert NOT_nb(0b0011, 4) == 0b1100
     
-    # AND
-    assert AND(False, False) == False
-    assert AND(False, True) == False
-    assert AND(True, False) == False
-    assert AND(True, True) == True
+    # Any truthy value counts as 1, as with the scalar gates
+    assert bits_to_int([2, 0, -1]) == 0b101
+    assert AND_n([2, 0], [1, 0]) == (True, False)
     
-    # OR
-    assert OR(False, False) == False
-    assert OR(False, True) == True
-    assert OR(True, False) == True
-    assert OR(True, True) == True
+    # Gate outputs (tuples) chain straight into the next gate
+    assert AND_n(NOT_n(a), b) == (False, False, True, False)
+    assert MUX_n(NOT_n(a), b, True) == tuple(b)
+    assert MUX8WAY(NOT_n(a + b), (True, True, True)) == True
+    assert DMUX8WAY(True, NOT_n([True, False, True])) == DMUX8WAY(True, [False, True, False])
     
-    # XOR
-    assert XOR(False, False) == False
-    assert XOR(False, True) == True
-    assert XOR(True, False) == True
-    assert XOR(True, True) == False
+    # Wide words take the C-level conversion path
+    word = 0xDEADBEEFCAFEF00D
+    assert int_to_bits(word, 64) == [bool((word >> i) & 1) for i in range(64)]
+    assert bits_to_int(int_to_bits(word, 64)) == word
+    assert NOT_n(int_to_bits(word, 64)) == tuple(int_to_bits(~word, 64))
+    assert bits_to_int([2, 0, -1, 0] * 4) == 0x5555
     
-    print("✓ Basic gate tests passed")
+    _log.write("✓ Basic gate tests passed\n")
 
 
 def test_composite_gates():
@@ -62,127 +149,171 @@ def test_composite_gates():
     assert DMUX(False, False) == (False, False)
     assert DMUX(False, True) == (False, False)
     
-    print("✓ Composite gate tests passed")
+    # Wide MUX/DMUX match their gate-level trees
+    for s in range(8):
+        sel = [bool((s >> i) & 1) for i in range(3)]
+        for x in range(256):
+            inputs = [bool((x >> i) & 1) for i in range(8)]
+            assert MUX8WAY(inputs, sel) == MUX8WAY_gates(inputs, sel)
+            assert MUX4WAY(*inputs[:4], sel[:2]) == MUX4WAY_gates(*inputs[:4], sel[:2])
+        for bit in [False, True]:
+            assert DMUX(bit, sel[0]) == DMUX_gates(bit, sel[0])
+            assert DMUX4WAY(bit, sel[:2]) == DMUX4WAY_gates(bit, sel[:2])
+            assert DMUX8WAY(bit, sel) == DMUX8WAY_gates(bit, sel)
+    
+    # Word muxes take any truthy select bit and return bools
+    words = [BITS4[v] for v in range(8)]
+    assert MUX_n([0, 1, 0, 0], [2, 0, 0, 0], 5) == (True, False, False, False)
+    assert MUX4WAY_n(*words[:4], [2, 0]) == tuple(BITS4[1])
+    assert MUX8WAY_n(words, [2, 0, -1]) == tuple(BITS4[5])
+    
+    _log.write("✓ Composite gate tests passed\n")
 
 
 def test_adders():
     """Test half and full adders."""
-    # Half adder
-    assert half_adder(False, False) == (False, False)
-    assert half_adder(False, True) == (True, False)
-    assert half_adder(True, False) == (True, False)
-    assert half_adder(True, True) == (False, True)
+    # Half adder: sum = a ^ b, carry = a & b
+    for i in range(4):
+        a, b = i >> 1, i & 1
+        assert half_adder(bool(a), bool(b)) == (bool(a ^ b), bool(a & b))
+    
+    # Full adder: sum = a ^ b ^ c, carry = majority(a, b, c)
+    for i in range(8):
+        a, b, c = (i >> 2) & 1, (i >> 1) & 1, i & 1
+        carry = (a & b) | (c & (a ^ b))
+        assert full_adder(bool(a), bool(b), bool(c)) == (bool(a ^ b ^ c), bool(carry))
     
-    # Full adder
-    assert full_adder(False, False, False) == (False, False)
-    assert full_adder(True, True, False) == (False, True)
-    assert full_adder(True, True, True) == (True, True)
+    # N-bit adder matches the gate-level ripple carry adder
+    for x in range(16):
+        for y in range(16):
+            a, b = BITS4[x], BITS4[y]
+            assert add_n(a, b) == add_n_gates(a, b)
+            assert sub_n(a, b) == BITS4[(x - y) & 0xF]
+        assert increment_n(BITS4[x]) == BITS4[(x + 1) & 0xF]
     
-    print("✓ Adder tests passed")
+    # 8-bit add_n over every operand pair; the n+1 bit result (carry out
+    # as the top bit) is exactly the integer sum
+    for x in range(256):
+        a = BITS8[x]
+        for y in range(256):
+            assert bits_to_int(add_n(a, BITS8[y])) == x + y, (x, y)
+    
+    _log.write("✓ Adder tests passed\n")
 
 
 def test_alu():
     """Test ALU operations."""
-    def int_to_bits(val, n=8):
-        return [bool((val >> i) & 1) for i in range(n)]
-    
-    def bits_to_int(bits):
-        return sum(b << i for i, b in enumerate(bits))
-    
-    alu = ALU(n_bits=8)
+    alu = _ALU8
     
-    # Test ADD
-    result = alu.compute(int_to_bits(42), int_to_bits(18), 0)  # ADD
-    assert bits_to_int(result) == 60
+    # (a, b, opcode, expected)
+    cases = (
+        (42, 18, 0, 60),                          # ADD
+        (100, 25, 1, 75),                         # SUB
+        (0b11110000, 0b10101010, 2, 0b10100000),  # AND
+        (0b11110000, 0b10101010, 3, 0b11111010),  # OR
+    )
+    for a, b, opcode, expected in cases:
+        assert bits_to_int(ALU_GATES[opcode](BITS8[a], BITS8[b])) == expected
+        assert alu.compute(BITS8[a], BITS8[b], opcode) == BITS8[expected].tolist()
     
-    # Test SUB
-    result = alu.compute(int_to_bits(100), int_to_bits(25), 1)  # SUB
-    assert bits_to_int(result) == 75
+    # Integer interface and flags
+    assert alu.compute_int(200, 100, 0) == 44  # ADD wraps at 8 bits
+    assert alu.compute_int(5, 5, 1) == 0 and alu.zero_flag
+    assert alu.compute_int(0, 1, 1) == 0xFF and alu.negative_flag
+    assert alu.compute_int(0b10101010, 0, 5) == 0b01010101  # NOT
+    assert alu.compute_int(0x1A5, 0x300, 6) == 0xA5 and alu.negative_flag  # masked
+    assert ALU.from_bits(alu.to_bits(0xA5)) == 0xA5
     
-    # Test AND
-    result = alu.compute(int_to_bits(0b11110000), int_to_bits(0b10101010), 2)
-    assert bits_to_int(result) == 0b10100000
+    # Every opcode over every pair of 8-bit operands matches the gate level
+    for opcode, reference in enumerate(ALU_GATES):
+        for a in range(256):
+            bits_a = BITS8[a]
+            for b in range(256):
+                expected = reference(bits_a, BITS8[b])
+                assert alu.compute_int(a, b, opcode) == bits_to_int(expected), (a, b, opcode)
+                assert alu.zero_flag == (not any(expected))
+                assert alu.negative_flag == bool(expected[7])
     
-    # Test OR
-    result = alu.compute(int_to_bits(0b11110000), int_to_bits(0b10101010), 3)
-    assert bits_to_int(result) == 0b11111010
-    
-    print("✓ ALU tests passed")
+    _log.write("✓ ALU tests passed\n")
 
 
 def test_hello_world():
     """Test Hello World program execution."""
-    sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'assembly'))
-    sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'vm'))
-    
-    from assembler import Assembler
-    from emulator import VM
+    _require(_HELLO)
     
     # Assemble hello world
-    assembler = Assembler()
-    asm_file = os.path.join(os.path.dirname(__file__), '..', 
-                           'assembly', 'examples', 'hello_world.asm')
-    
-    machine_code = assembler.assemble_file(asm_file)
+    machine_code = _assemble(_HELLO, os.path.getmtime(_HELLO))
     
     # Run in VM
-    vm = VM()
+    vm = _VM
+    vm.reset()
     vm.load_program(machine_code)
-    vm.run()
+    vm.run(max_instructions=_MAX_INSTRUCTIONS)
+    assert vm.halted, f"Program did not halt within {_MAX_INSTRUCTIONS} instructions"
     
     # Check output
     output = vm.get_output()
     assert output == "Hello, World!\n", f"Expected 'Hello, World!\\n', got {repr(output)}"
     
-    print("✓ Hello World program test passed")
+    _log.write("✓ Hello World program test passed\n")
 
 
 def test_counter():
     """Test counter program."""
-    sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'assembly'))
-    sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'vm'))
-    
-    from assembler import Assembler
-    from emulator import VM
-    
-    assembler = Assembler()
-    asm_file = os.path.join(os.path.dirname(__file__), '..', 
-                           'assembly', 'examples', 'counter.asm')
+    _require(_COUNTER)
     
-    machine_code = assembler.assemble_file(asm_file)
+    machine_code = _assemble(_COUNTER, os.path.getmtime(_COUNTER))
     
-    vm = VM()
+    vm = _VM
+    vm.reset()
     vm.load_program(machine_code)
-    vm.run()
+    vm.run(max_instructions=_MAX_INSTRUCTIONS)
+    assert vm.halted, f"Program did not halt within {_MAX_INSTRUCTIONS} instructions"
     
     output = vm.get_output()
     assert output == "0123456789\n", f"Expected '0123456789\\n', got {repr(output)}"
     
-    print("✓ Counter program test passed")
+    _log.write("✓ Counter program test passed\n")
+
+
+# Run order for the script runner below (pytest collects test_* itself)
+TESTS = (
+    test_nand,
+    test_basic_gates,
+    test_composite_gates,
+    test_adders,
+    test_alu,
+    test_hello_world,
+    test_counter,
+)
 
 
 if __name__ == "__main__":
     print("\nNAND Compute Test Suite")
     print("=" * 50)
     
-    try:
-        test_nand()
-        test_basic_gates()
-        test_composite_gates()
-        test_adders()
-        test_alu()
-        test_hello_world()
-        test_counter()
-        
-        print("=" * 50)
-        print("✓ All tests passed!")
-        print("\nYour computer built from NAND gates is working! 🎉")
-        
-    except AssertionError as e:
-        print(f"\n✗ Test failed: {e}")
-        sys.exit(1)
-    except Exception as e:
-        print(f"\n✗ Error: {e}")
-        import traceback
-        traceback.print_exc()
+    # Run every test, so one failure does not hide the others. Tests run
+    # serially: each VM program finishes in well under a millisecond, so
+    # handing them to worker processes would cost more than it saves.
+    failures = 0
+    for test in TESTS:
+        try:
+            test()
+        except unittest.SkipTest as e:
+            print(f"- {test.__name__} skipped: {e}")
+        except AssertionError as e:
+            failures += 1
+            print(f"\n✗ {test.__name__} failed: {e}")
+        except Exception as e:
+            failures += 1
+            print(f"\n✗ {test.__name__} error: {e}")
+            traceback.print_exc()
+    
+    sys.stdout.write(_log.getvalue())
+    print("=" * 50)
+    if failures:
+        print(f"✗ {failures} of {len(TESTS)} tests failed")
         sys.exit(1)
+    
+    print("✓ All tests passed!")
+    print("\nYour computer built from NAND gates is working! 🎉")
@@ -13,11 +13,17 @@ class VM:
     """Virtual Machine for NAND Compute."""
     
     def __init__(self, memory_size=256):
+        # Memory (256 bytes)
+        self.memory = [0] * memory_size
+        
+        self.reset()
+    
+    def reset(self):
+        """Clear registers, memory, flags and output, as on power-up."""
         # 8 general-purpose registers
         self.registers = [0] * 8
         
-        # Memory (256 bytes)
-        self.memory = [0] * memory_size
+        self.memory[:] = [0] * len(self.memory)
         
         # Program counter
         self.pc = 0
@@ -173,7 +179,10 @@ class VM:
         self.halted = False
         self.instruction_count = 0
         
-        while not self.halted and self.instruction_count < max_instructions:
+        for _ in range(max_instructions):
+            if self.halted:
+                break
+            
             instruction = self.fetch()
             
             if debug: